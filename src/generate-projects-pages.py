@@ -3,10 +3,20 @@ from __future__ import annotations
 
 from pathlib import Path
 from typing import Any, Dict, List, Optional
+import datetime as dt
+import json
+import re
 import shutil
 
 import yaml
 
+try:  # libyaml-backed loader when available
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # pure-Python fallback
+    from yaml import SafeLoader
+
+from sync_utils import write_if_changed
+
 
 ROOT = Path(__file__).resolve().parents[1]
 L_PATH = Path("data/projects.yml")
@@ -27,30 +37,31 @@ def _is_github(link: Optional[str]) -> bool:
     return bool(link) and "github.com" in link
 
 
+REQUEST_ACCESS_URL = (
+    "https://github.com/fs-ise/handbook/issues/new"
+    "?assignees=geritwagner"
+    "&labels=access+request"
+    "&template=request-repo-access.md"
+    "&title=%5BAccess+Request%5D+Request+for+access+to+repository"
+)
+REQUEST_ACCESS_HTML = (
+    f'<a href="{REQUEST_ACCESS_URL}" target="_blank" rel="noopener">'
+    f'<img src="https://img.shields.io/badge/Request-Access-blue" alt="Request Access">'
+    f"</a>"
+)
+
+
 def _request_access_html(link: Optional[str]) -> str:
-    if not _is_github(link):
-        return "—"
-    url = (
-        "https://github.com/fs-ise/handbook/issues/new"
-        "?assignees=geritwagner"
-        "&labels=access+request"
-        "&template=request-repo-access.md"
-        "&title=%5BAccess+Request%5D+Request+for+access+to+repository"
-    )
-    return (
-        f'<a href="{url}" target="_blank" rel="noopener">'
-        f'<img src="https://img.shields.io/badge/Request-Access-blue" alt="Request Access">'
-        f"</a>"
-    )
+    return REQUEST_ACCESS_HTML if _is_github(link) else "—"
 
 
-def _resources_table(resources: List[Dict[str, Any]]) -> str:
+def _resources_table(resources: List[Dict[str, Any]], parts: List[str]) -> None:
     if not resources:
-        return "—\n"
+        parts.append("—\n")
+        return
 
-    lines: List[str] = []
-    lines.append("| Name | Access | Request |")
-    lines.append("|---|---|---|")
+    parts.append("| Name | Access | Request |\n")
+    parts.append("|---|---|---|\n")
 
     for res in resources:
         name = res.get("name") or "—"
@@ -71,38 +82,127 @@ def _resources_table(resources: List[Dict[str, Any]]) -> str:
 
         request_cell = _request_access_html(link)
 
-        lines.append(f"| {name_cell} | {access_cell} | {request_cell} |")
+        parts.append(f"| {name_cell} | {access_cell} | {request_cell} |\n")
 
-    return "\n".join(lines) + "\n"
 
-
-def _history_block(history: List[Dict[str, Any]]) -> str:
+def _history_block(history: List[Dict[str, Any]], parts: List[str]) -> None:
     if not history:
-        return "—\n"
-    items: List[str] = []
+        parts.append("—\n")
+        return
     for h in history:
-        items.append(f"- **{_fmt_date(h.get('date'))}** — {h.get('event','—')}")
-    return "\n".join(items) + "\n"
+        parts.append(f"- **{_fmt_date(h.get('date'))}** — {h.get('event','—')}\n")
 
 
-def _output_block(project_output: Any) -> str:
+def _output_block(project_output: Any, parts: List[str]) -> None:
     """
     Render manual links to internal paper pages, e.g.
     ## Output
     - [WagnerThurner2025](/research/papers/WagnerThurner2025.html)
     """
     if not isinstance(project_output, list):
-        return ""
+        return
 
     keys = [k.strip() for k in project_output if isinstance(k, str) and k.strip()]
     if not keys:
-        return ""
+        return
 
-    lines: List[str] = []
-    lines.append("## Output")
+    parts.append("## Output\n")
     for k in keys:
-        lines.append(f"- [{k}]({PAPERS_BASE_PATH}/{k}.html)")
-    return "\n".join(lines) + "\n"
+        parts.append(f"- [{k}]({PAPERS_BASE_PATH}/{k}.html)\n")
+
+
+# Strings that can be emitted as plain (unquoted) YAML scalars: start with a letter,
+# no ": " / " #" sequences, no trailing colon or whitespace (non-printable
+# characters are excluded separately in _yaml_scalar).
+_PLAIN_SCALAR = re.compile(r"[A-Za-z][^\s]*(?: [^\s#][^\s]*)*")
+_YAML_RESERVED_WORDS = {"y", "yes", "n", "no", "true", "false", "on", "off", "null"}
+
+
+def _yaml_float(value: float) -> str:
+    # Same spelling as PyYAML's float representer
+    if value != value:
+        return ".nan"
+    if value in (float("inf"), float("-inf")):
+        return ".inf" if value > 0 else "-.inf"
+    text = repr(value).lower()
+    # YAML 1.1 floats need a "." (1e-05 would load as a string)
+    if "." not in text and "e" in text:
+        text = text.replace("e", ".0e", 1)
+    return text
+
+
+def _yaml_scalar(value: Any) -> str:
+    if value is None:
+        return "null"
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, int):
+        return str(value)
+    if isinstance(value, float):
+        return _yaml_float(value)
+    if isinstance(value, (dt.date, dt.datetime)):
+        return value.isoformat()
+    text = str(value)
+    if (
+        _PLAIN_SCALAR.fullmatch(text)
+        and text.isprintable()
+        and ": " not in text
+        and not text.endswith(":")
+        and text.lower() not in _YAML_RESERVED_WORDS
+    ):
+        return text
+    # JSON strings are valid double-quoted YAML scalars; escape everything when
+    # non-printables are present (raw NEL / U+2028 would be read as line breaks)
+    return json.dumps(text, ensure_ascii=not text.isprintable())
+
+
+def _yaml_mapping_lines(mapping: Dict[str, Any], indent: int) -> List[str]:
+    pad = " " * indent
+    lines: List[str] = []
+    for key, value in mapping.items():
+        key_str = _yaml_scalar(key)
+        if isinstance(value, dict) and value:
+            lines.append(f"{pad}{key_str}:")
+            lines.extend(_yaml_mapping_lines(value, indent + 2))
+        elif isinstance(value, list) and value:
+            # Block sequences inside mappings are not indented (PyYAML default style)
+            lines.append(f"{pad}{key_str}:")
+            lines.extend(_yaml_sequence_lines(value, indent))
+        elif isinstance(value, dict):
+            lines.append(f"{pad}{key_str}: {{}}")
+        elif isinstance(value, list):
+            lines.append(f"{pad}{key_str}: []")
+        else:
+            lines.append(f"{pad}{key_str}: {_yaml_scalar(value)}")
+    return lines
+
+
+def _yaml_sequence_lines(items: List[Any], indent: int) -> List[str]:
+    pad = " " * indent
+    lines: List[str] = []
+    for item in items:
+        if isinstance(item, dict) and item:
+            nested = _yaml_mapping_lines(item, indent + 2)
+        elif isinstance(item, list) and item:
+            nested = _yaml_sequence_lines(item, indent + 2)
+        elif isinstance(item, dict):
+            lines.append(f"{pad}- {{}}")
+            continue
+        elif isinstance(item, list):
+            lines.append(f"{pad}- []")
+            continue
+        else:
+            lines.append(f"{pad}- {_yaml_scalar(item)}")
+            continue
+        # Put the first nested line on the "- " line
+        nested[0] = f"{pad}- " + nested[0][indent + 2 :]
+        lines.extend(nested)
+    return lines
+
+
+def _emit_yaml(fm: Dict[str, Any]) -> str:
+    """Emit block-style YAML for the front matter without yaml.safe_dump."""
+    return "\n".join(_yaml_mapping_lines(fm, 0))
 
 
 def _frontmatter(project: Dict[str, Any]) -> str:
@@ -121,54 +221,51 @@ def _frontmatter(project: Dict[str, Any]) -> str:
     }
 
     # Option C: do NOT add bibliography/csl/nocite/reference-section-title
-    return "---\n" + yaml.safe_dump(fm, sort_keys=False).strip() + "\n---\n"
+    return "---\n" + _emit_yaml(fm) + "\n---\n"
 
 
-def render_project_page(project: Dict[str, Any]) -> str:
-    pid = project["id"]
-    status = project.get("status", "planned")
-    collaborators = project.get("collaborators", [])
-    collab_str = ", ".join(collaborators) if collaborators else "—"
-
-    resources_md = _resources_table(project.get("project_resources", []))
-    history_md = _history_block(project.get("project_history", []))
-    output_md = _output_block(project.get("project_output", []))
-
-    info_callout = f"""
+INFO_CALLOUT = f"""
 ::: {{.callout-note icon=false}}
 This page is auto-generated. The authoritative project metadata is stored in
 [`data/projects.yml`](https://github.com/fs-ise/handbook/tree/main/{L_PATH.as_posix()}){{target=_blank}}.
 :::
 """.strip()
 
-    # Output moved to *after* History
-    body = f"""
-
-{info_callout}
-
-Field | Value
----|---
-Acronym | `{pid}`
-Team | {collab_str}
-Status | `{status}`
 
-## Resources
-{resources_md}
-
-## History
-{history_md}
+def render_project_page(project: Dict[str, Any]) -> str:
+    pid = project["id"]
+    status = project.get("status", "planned")
+    collaborators = project.get("collaborators", [])
+    collab_str = ", ".join(collaborators) if collaborators else "—"
 
-{output_md}
-""".lstrip()
+    parts: List[str] = [
+        _frontmatter(project),
+        "\n",
+        INFO_CALLOUT,
+        "\n\nField | Value\n---|---\n",
+        f"Acronym | `{pid}`\n",
+        f"Team | {collab_str}\n",
+        f"Status | `{status}`\n",
+        "\n## Resources\n",
+    ]
+    _resources_table(project.get("project_resources", []), parts)
+    parts.append("\n\n## History\n")
+    _history_block(project.get("project_history", []), parts)
+    # Output moved to *after* History
+    parts.append("\n\n")
+    _output_block(project.get("project_output", []), parts)
+    parts.append("\n")
 
-    return _frontmatter(project) + "\n" + body
+    return "".join(parts)
 
 
-def _clear_out_dir(out_dir: Path) -> None:
-    """Remove all files/subdirs in research/projects before regenerating pages."""
+def _clear_out_dir(out_dir: Path, keep: set[str]) -> None:
+    """Remove files/subdirs in research/projects that are not in keep (stale pages)."""
     if not out_dir.exists():
         return
     for p in out_dir.iterdir():
+        if p.name in keep:
+            continue
         if p.is_file() or p.is_symlink():
             p.unlink()
         elif p.is_dir():
@@ -176,20 +273,25 @@ def _clear_out_dir(out_dir: Path) -> None:
 
 
 def main() -> None:
-    # Start by removing all files in research/projects
-    _clear_out_dir(OUT_DIR)
-    OUT_DIR.mkdir(parents=True, exist_ok=True)
-
-    projects = yaml.safe_load(DATA_FILE.read_text(encoding="utf-8"))
+    projects = yaml.load(DATA_FILE.read_text(encoding="utf-8"), Loader=SafeLoader)
     if not isinstance(projects, list):
         raise SystemExit("projects.yml must be a list of project entries")
 
-    for p in projects:
-        pid = p["id"]
-        out_file = OUT_DIR / f"{pid}.qmd"
-        out_file.write_text(render_project_page(p), encoding="utf-8")
+    pages = {f"{p['id']}.qmd": render_project_page(p) for p in projects}
+
+    # Remove pages of projects that no longer exist in projects.yml
+    _clear_out_dir(OUT_DIR, keep=set(pages))
+    OUT_DIR.mkdir(parents=True, exist_ok=True)
 
-    print(f"Generated {len(projects)} project pages in {OUT_DIR}")
+    written = 0
+    for name, text in pages.items():
+        if write_if_changed(OUT_DIR / name, text):
+            written += 1
+
+    print(
+        f"Generated {len(projects)} project pages in {OUT_DIR} "
+        f"({written} written, {len(pages) - written} unchanged)"
+    )
 
 
 if __name__ == "__main__":
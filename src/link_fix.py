@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import functools
 import os
 import re
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
 from pathlib import Path
 from typing import Iterable
 from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
@@ -24,6 +27,9 @@ MARKDOWN_HTTP_LINK_PATTERN = re.compile(
 #   [text](dest)
 MARKDOWN_LINK_PATTERN = re.compile(r"(?<!\!)\[(?P<text>[^\]]+)\]\((?P<dest>[^)]+)\)")
 
+# Match target blank inside an attribute block: target="_blank" or target=_blank
+TARGET_BLANK_PATTERN = re.compile(r'target\s*=\s*("_blank"|_blank)')
+
 SKIP_URL_SUBSTRINGS = ("img.shields.io",)
 
 # Treat these as "assets", not pages (skip in internal-link checking;
@@ -39,21 +45,54 @@ ASSET_SUFFIXES = (
 )
 
 
+CONTENT_SUFFIXES = (".md", ".qmd")
+
+# Build output, VCS and environment directories are never descended into
+# (a superset of the lychee --exclude-path list in links_fix.yml, which skips
+# _site, _freeze, .git and node_modules).
+EXCLUDED_DIRS = frozenset(
+    {"_site", "_freeze", ".quarto", ".git", "node_modules", ".venv", "venv"}
+)
+
+# Thread pool size for the per-file pass in main()
+MAX_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+
+def _scan_content_files(dir_path: str) -> Iterable[str]:
+    """Recursively yield .md/.qmd file paths below dir_path using os.scandir."""
+    with os.scandir(dir_path) as it:
+        entries = list(it)
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            if entry.name not in EXCLUDED_DIRS:
+                yield from _scan_content_files(entry.path)
+        elif entry.is_file(follow_symlinks=False) and entry.name.endswith(CONTENT_SUFFIXES):
+            yield entry.path
+
+
 def iter_content_files(root: Path) -> Iterable[Path]:
     """Yield .md and .qmd files (skip root-level files)."""
-    for p in root.rglob("*"):
-        if not p.is_file():
-            continue
-        if p.suffix not in {".md", ".qmd"}:
-            continue
-        if len(p.relative_to(root).parts) == 1:
-            continue
-        yield p
+    with os.scandir(root) as it:
+        subdirs = [
+            entry.path
+            for entry in it
+            if entry.is_dir(follow_symlinks=False) and entry.name not in EXCLUDED_DIRS
+        ]
+    for dir_path in subdirs:
+        for path in _scan_content_files(dir_path):
+            yield Path(path)
 
 
 def strip_fragment_and_query(url: str) -> str:
     """Remove #fragment and ?query for suffix checks, keeping the path-ish portion."""
-    return url.split("#", 1)[0].split("?", 1)[0].strip()
+    end = len(url)
+    i = url.find("#")
+    if i != -1:
+        end = i
+    j = url.find("?", 0, end)
+    if j != -1:
+        end = j
+    return url[:end].strip()
 
 
 def is_asset_link(url: str) -> bool:
@@ -97,7 +136,7 @@ def attrs_already_have_target_blank(attrs: str) -> bool:
       - target="_blank"
       - target=_blank
     """
-    return bool(re.search(r'target\s*=\s*("_blank"|_blank)', attrs))
+    return "target" in attrs and bool(TARGET_BLANK_PATTERN.search(attrs))
 
 
 def normalize_to_brace_attrs(existing_attrs: str) -> str:
@@ -112,9 +151,8 @@ def normalize_to_brace_attrs(existing_attrs: str) -> str:
     return inner
 
 
-def append_target_blank_to_http_links(file_path: Path) -> bool:
+def append_target_blank_to_http_links(content: str) -> str:
     """Add {target=_blank} to http(s) links unless already present (any form)."""
-    content = file_path.read_text(encoding="utf-8")
 
     def add_target_blank(match: re.Match) -> str:
         text = match.group("text")
@@ -142,20 +180,17 @@ def append_target_blank_to_http_links(file_path: Path) -> bool:
 
         return link + "{target=_blank}"
 
-    updated = MARKDOWN_HTTP_LINK_PATTERN.sub(add_target_blank, content)
-
-    if updated != content:
-        file_path.write_text(updated, encoding="utf-8")
-        print(f"Updated external links in {file_path}")
-        return True
+    # Cheap substring prefilter: skip the regex scan for files without http links
+    if "](http" not in content:
+        return content
 
-    print(f"No changes needed in {file_path}")
-    return False
+    return MARKDOWN_HTTP_LINK_PATTERN.sub(add_target_blank, content)
 
 
-def candidates_for_quarto_source(file_path: Path, link: str, repo_root: Path) -> list[Path]:
+def candidates_for_quarto_source(file_dir: str, link: str, repo_root: str) -> list[str]:
     """
-    Given an internal link target, return plausible Quarto source candidates.
+    Given an internal link target, return plausible Quarto source candidates
+    (as plain path strings, resolved against file_dir or repo_root).
 
     Supports:
     - pretty URLs (no extension): foo/bar/baz
@@ -169,7 +204,7 @@ def candidates_for_quarto_source(file_path: Path, link: str, repo_root: Path) ->
     For directory links (ending with '/'), we check:
       - target/index.qmd / target/index.md
     """
-    clean = link.split("#", 1)[0].split("?", 1)[0].strip()
+    clean = strip_fragment_and_query(link)
 
     # Strip .html if present (old behavior)
     if clean.endswith(".html"):
@@ -183,36 +218,50 @@ def candidates_for_quarto_source(file_path: Path, link: str, repo_root: Path) ->
     # Resolve Quarto site-root paths
     if clean.startswith("/"):
         clean = clean.lstrip("/")
-        base = repo_root / clean
+        base = os.path.join(repo_root, clean) if clean else repo_root
     else:
-        base = file_path.parent / clean
+        base = os.path.join(file_dir, clean) if clean else file_dir
 
     if is_dir:
         return [
-            base / "index.qmd",
-            base / "index.md",
+            base + "/index.qmd",
+            base + "/index.md",
         ]
 
     return [
-        Path(str(base) + ".qmd"),
-        Path(str(base) + ".md"),
-        base / "index.qmd",
-        base / "index.md",
+        base + ".qmd",
+        base + ".md",
+        base + "/index.qmd",
+        base + "/index.md",
     ]
 
 
+@functools.lru_cache(maxsize=None)
+def _exists(path: str) -> bool:
+    """Memoized os.path.exists (many pages link to the same targets)."""
+    return os.path.exists(path)
+
+
 def is_templated_link(dest: str) -> bool:
     d = dest.strip()
     return d.startswith(("{{<", "{{%"))
 
 
-def check_internal_links(file_path: Path, repo_root: Path) -> list[tuple[str, list[Path]]]:
+def check_internal_links(
+    file_path: Path, content: str, repo_root: Path
+) -> list[tuple[str, list[str]]]:
     """
     For each internal markdown link target, verify at least one plausible source exists.
     Returns list of (link, candidates) for broken ones.
     """
-    content = file_path.read_text(encoding="utf-8")
-    broken: list[tuple[str, list[Path]]] = []
+    broken: list[tuple[str, list[str]]] = []
+
+    # Cheap substring prefilter: skip the regex scan for files without links
+    if "](" not in content:
+        return broken
+
+    file_dir = os.path.dirname(file_path)
+    root = str(repo_root)
 
     for m in MARKDOWN_LINK_PATTERN.finditer(content):
         link = strip_chatgpt_utm(m.group("dest").strip())
@@ -236,15 +285,39 @@ def check_internal_links(file_path: Path, repo_root: Path) -> list[tuple[str, li
         if "_news" in link:
             continue
 
-        cands = candidates_for_quarto_source(file_path, link, repo_root=repo_root)
-        if not any(p.exists() for p in cands):
+        cands = candidates_for_quarto_source(file_dir, link, repo_root=root)
+        if not any(_exists(p) for p in cands):
             broken.append((link, cands))
 
     return broken
 
 
+def _replace_file(file_path: Path, text: str) -> None:
+    """Write text to a sibling temp file and atomically move it over file_path."""
+    tmp = file_path.with_suffix(file_path.suffix + ".tmp")
+    tmp.write_text(text, encoding="utf-8")
+    os.replace(tmp, file_path)
+
+
+def process_file(file_path: Path, repo_root: Path) -> list[tuple[str, list[str]]]:
+    """
+    Read a content file once, add {target=_blank} to its external links
+    (writing it back if changed) and return its broken internal links.
+    """
+    content = file_path.read_text(encoding="utf-8")
+
+    updated = append_target_blank_to_http_links(content)
+    if updated != content:
+        _replace_file(file_path, updated)
+        print(f"Updated external links in {file_path}")
+    else:
+        print(f"No changes needed in {file_path}")
+
+    return check_internal_links(file_path, updated, repo_root=repo_root)
+
+
 def write_broken_links_report(
-    broken: dict[Path, list[tuple[str, list[Path]]]],
+    broken: dict[Path, list[tuple[str, list[str]]]],
     repo_root: Path,
 ) -> None:
     report_path = Path("broken_links.md")
@@ -254,21 +327,29 @@ def write_broken_links_report(
         print("No broken internal links found.")
         return
 
-    with report_path.open("w", encoding="utf-8") as f:
-        for src_file, items in sorted(broken.items(), key=lambda x: str(x[0])):
-            rel = src_file.relative_to(repo_root).as_posix()
+    # Assemble the report in memory and write it with a single call
+    parts: list[str] = []
+    # Stringify each source path once and sort on that string
+    entries = [
+        (src_file.relative_to(repo_root).as_posix(), items)
+        for src_file, items in broken.items()
+    ]
+    entries.sort(key=itemgetter(0))
+
+    for rel, items in entries:
+        if repo:
+            # Direct link to GitHub's editor
+            edit_url = f"{server}/{repo}/edit/main/{rel}"
+            parts.append(f"## In [{rel}]({edit_url})\n\n")
+        else:
+            parts.append(f"## In `{rel}`\n\n")
 
-            if repo:
-                # Direct link to GitHub's editor
-                edit_url = f"{server}/{repo}/edit/main/{rel}"
-                f.write(f"## In [{rel}]({edit_url})\n\n")
-            else:
-                f.write(f"## In `{rel}`\n\n")
+        parts.append("The following links are broken:")
+        for link, _cands in items:
+            parts.append(f"\n```sh\n{link}\n```\n")
+        parts.append("\n")
 
-            f.write("The following links are broken:")
-            for link, _cands in items:
-                f.write(f"\n```sh\n{link}\n```\n")
-            f.write("\n")
+    report_path.write_text("".join(parts), encoding="utf-8")
 
 
 def sort_lycheeignore_file(path: Path) -> bool:
@@ -329,16 +410,18 @@ def sort_lycheeignore_file(path: Path) -> bool:
 def main() -> None:
     root = Path.cwd()
 
-    # 1) Add {target=_blank} to external links in .md/.qmd (excluding root-level files)
-    #    and remove ?utm_source=chatgpt.com from those URLs
-    for fp in iter_content_files(root):
-        append_target_blank_to_http_links(fp)
-
+    # For each .md/.qmd (excluding root-level files), in a single read:
+    # 1) Add {target=_blank} to external links and remove ?utm_source=chatgpt.com
+    #    from those URLs
     # 2) Check internal links (pretty URLs, .html, etc.) against plausible Quarto sources
     #    (and ignore/remove utm_source=chatgpt.com when evaluating)
-    broken: dict[Path, list[tuple[str, list[Path]]]] = {}
-    for fp in iter_content_files(root):
-        b = check_internal_links(fp, repo_root=root)
+    #    Files are independent and I/O bound, so they are processed in a thread pool.
+    files = list(iter_content_files(root))
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as ex:
+        results = list(ex.map(lambda fp: process_file(fp, repo_root=root), files))
+
+    broken: dict[Path, list[tuple[str, list[str]]]] = {}
+    for fp, b in zip(files, results):
         if b:
             broken[fp] = b
 
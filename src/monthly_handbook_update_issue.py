@@ -58,20 +58,23 @@ def main() -> None:
     gh = Github(token)
     repo = gh.get_repo(repo_full)
 
-    # Find existing open issue with matching title
-    target_issue = None
-    for issue in repo.get_issues(state="open"):
-        if issue.title.strip() == ISSUE_TITLE:
-            target_issue = issue
-            break
-
-    if target_issue is None:
-        # If none open, see if there's a closed one to re-open (keeps history in one place)
-        for issue in repo.get_issues(state="closed"):
-            if issue.title.strip() == ISSUE_TITLE:
-                target_issue = issue
-                target_issue.edit(state="open")
-                break
+    # Find existing issues with matching title (server-side title search instead of
+    # paging through all open/closed issues). Newest first, like get_issues();
+    # the search index can lag a little behind very recent issue changes.
+    query = f'repo:{repo_full} is:issue in:title "{ISSUE_TITLE}"'
+    matches = [
+        i
+        for i in gh.search_issues(query, sort="created", order="desc")
+        if i.title.strip() == ISSUE_TITLE
+    ]
+
+    # Prefer an open issue
+    target_issue = next((i for i in matches if i.state == "open"), None)
+
+    if target_issue is None and matches:
+        # If none open, re-open a closed one (keeps history in one place)
+        target_issue = matches[0]
+        target_issue.edit(state="open")
 
     if target_issue is None:
         target_issue = repo.create_issue(
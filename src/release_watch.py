@@ -10,17 +10,28 @@
 
 from __future__ import annotations
 
+import json
 import re
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Dict, List, Optional, Set, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 import colrev.loader.load_utils
 import colrev.writer.write_utils
 
+try:  # faster decoding of large PyPI payloads when available
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 
 REFERENCES_BIB = Path("data/references.bib")
 NEWS_QMD = Path("news.qmd")
@@ -31,6 +42,15 @@ GITHUB_API_TAG_RELEASE = "https://api.github.com/repos/{owner}/{repo}/releases/t
 
 MAX_RELEASE_NOTES_CHARS = 1200
 
+GITHUB_URL_RE = re.compile(r"github\.com/([^/]+)/([^/#?]+)", re.IGNORECASE)
+GIT_SUFFIX_RE = re.compile(r"\.git$")
+GITHUB_URL_PREFIXES = ("https://github.com/", "http://github.com/")
+
+GITHUB_HEADERS = {"Accept": "application/vnd.github+json"}
+
+# Concurrent HTTP requests (PyPI / GitHub lookups are independent)
+MAX_WORKERS = 16
+
 
 @dataclass(frozen=True)
 class ReleaseInfo:
@@ -50,13 +70,27 @@ def utc_date_iso() -> str:
 # PyPI + GitHub
 # ---------------------------------------------------------------------
 
+def _build_session() -> requests.Session:
+    """Shared keep-alive session (one TLS connection per host) with retries."""
+    session = requests.Session()
+    retries = Retry(total=3, backoff_factor=0.3, status_forcelist=(502, 503, 504))
+    session.mount(
+        "https://",
+        HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=retries),
+    )
+    return session
+
+
+SESSION = _build_session()
+
+
 def fetch_latest_from_pypi(project: str, timeout: int = 20):
     url = PYPI_PROJECT_URL.format(project=project)
-    r = requests.get(url, timeout=timeout)
+    r = SESSION.get(url, timeout=timeout)
     if r.status_code == 404:
         return None
     r.raise_for_status()
-    data = r.json()
+    data = _json_loads(r.content)
     return data["info"]["version"], data["info"]["package_url"], data
 
 
@@ -64,32 +98,56 @@ def extract_github_repo(rec: dict) -> Optional[Tuple[str, str]]:
     gh = (rec.get("url_github") or "").strip()
     if not gh:
         return None
-    m = re.search(r"github\.com/([^/]+)/([^/#?]+)", gh, flags=re.IGNORECASE)
+
+    # Fast path for plain github.com URLs (the common case)
+    if gh.startswith(GITHUB_URL_PREFIXES):
+        owner, _, repo = gh.split("github.com/", 1)[1].partition("/")
+        for sep in "/#?":
+            repo = repo.split(sep, 1)[0]
+        if repo.endswith(".git"):
+            repo = repo[:-4]
+        if owner and repo:
+            return owner, repo
+
+    m = GITHUB_URL_RE.search(gh)
     if not m:
         return None
-    owner, repo = m.group(1), re.sub(r"\.git$", "", m.group(2))
+    owner, repo = m.group(1), GIT_SUFFIX_RE.sub("", m.group(2))
     return owner, repo
 
 
 def fetch_github_release_notes(owner: str, repo: str, version: str, timeout: int = 20):
-    session = requests.Session()
-    session.headers.update({"Accept": "application/vnd.github+json"})
-
     for tag in (f"v{version}", version):
         url = GITHUB_API_TAG_RELEASE.format(owner=owner, repo=repo, tag=tag)
-        r = session.get(url, timeout=timeout)
+        r = SESSION.get(url, headers=GITHUB_HEADERS, timeout=timeout)
         if r.status_code == 200:
             data = r.json()
             return data.get("body"), data.get("html_url")
 
     url = GITHUB_API_LATEST_RELEASE.format(owner=owner, repo=repo)
-    r = session.get(url, timeout=timeout)
+    r = SESSION.get(url, headers=GITHUB_HEADERS, timeout=timeout)
     if r.status_code != 200:
         return None, None
     data = r.json()
     return data.get("body"), data.get("html_url")
 
 
+def _safe_fetch_latest_from_pypi(project: str):
+    try:
+        return fetch_latest_from_pypi(project)
+    except Exception:
+        return None
+
+
+def _safe_fetch_github_release_notes(gh: Optional[Tuple[str, str]], version: str):
+    if not gh:
+        return None, None
+    try:
+        return fetch_github_release_notes(gh[0], gh[1], version)
+    except Exception:
+        return None, None
+
+
 # ---------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------
@@ -252,46 +310,39 @@ def main():
             if project:
                 software_items.append((rid, project))
 
-    projects = {project for _, project in software_items}
+    projects = sorted({project for _, project in software_items})
+
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as ex:
+        latest_by_project = {
+            project: res
+            for project, res in zip(projects, ex.map(_safe_fetch_latest_from_pypi, projects))
+            if res
+        }
+
+        releases = []
+        for rid, project in software_items:
+            if project not in latest_by_project:
+                continue
+            version, pypi_url, _ = latest_by_project[project]
+            releases.append(
+                ReleaseInfo(
+                    record_id=rid,
+                    project=project,
+                    version=version,
+                    pypi_url=pypi_url,
+                )
+            )
 
-    latest_by_project = {}
-    for project in projects:
-        try:
-            res = fetch_latest_from_pypi(project)
-            if res:
-                latest_by_project[project] = res
-        except Exception:
-            pass
+        software_updates = update_software_versions(records, releases)
 
-    releases = []
-    for rid, project in software_items:
-        if project not in latest_by_project:
-            continue
-        version, pypi_url, _ = latest_by_project[project]
-        rec = records[rid]
-
-        notes = None
-        notes_url = None
-
-        gh = extract_github_repo(rec)
-        if gh:
-            try:
-                notes, notes_url = fetch_github_release_notes(gh[0], gh[1], version)
-            except Exception:
-                pass
-
-        releases.append(
-            ReleaseInfo(
-                record_id=rid,
-                project=project,
-                version=version,
-                pypi_url=pypi_url,
-                release_notes=notes,
-                release_notes_url=notes_url,
+        # Release notes are only needed for versions that changed in references.bib
+        def with_notes(rel: ReleaseInfo) -> ReleaseInfo:
+            notes, notes_url = _safe_fetch_github_release_notes(
+                extract_github_repo(records[rel.record_id]), rel.version
             )
-        )
+            return replace(rel, release_notes=notes, release_notes_url=notes_url)
 
-    software_updates = update_software_versions(records, releases)
+        software_updates = list(ex.map(with_notes, software_updates))
 
     # -------------------------------------------------
     # New publications
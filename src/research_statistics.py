@@ -13,14 +13,23 @@ Integrated monthly activity reports for FS-ISE.
     - handbook_activity_over_time.png
 """
 
+import argparse
+import json
 import os
+import re
 import subprocess
 import calendar
 import datetime as dt
 from collections import defaultdict
-from pathlib import PurePosixPath
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 
+import numpy as np
 import pandas as pd
+import matplotlib
+
+matplotlib.use("Agg")  # headless: CI has no display
+
 import matplotlib.pyplot as plt
 import matplotlib.dates as mdates
 from github import Github, GithubException
@@ -32,11 +41,33 @@ from github import Github, GithubException
 
 ORG_NAME = "fs-ise"
 
+# Repos whose commits are collected concurrently
+MAX_WORKERS = 16
+
 RESEARCH_CSV = "assets/reports/research_repos_activity_per_month.csv"
 TEACH_CSV = "assets/reports/teaching_repos_activity_per_month.csv"
 LAB_CSV = "assets/reports/lab_management_repos_activity_per_month.csv"
 HANDBOOK_CSV = "assets/reports/handbook_growth.csv"
 
+MD_EXTS = (".md", ".markdown")
+
+# Numeric section prefix of a handbook page name, e.g. "10.01 Intro.md" -> "10"
+SECTION_NUMBER_RE = re.compile(r"(\d+)\.")
+
+# Per-commit rows of org repos, reused by --incremental runs. Committed (under
+# data/, not the published assets/reports/) because the monthly job runs less
+# often than GitHub evicts unused actions/cache entries (7 days).
+COMMITS_CACHE_CSV = "data/cache/org_commits.csv"
+# When the cache was last fetched / last rebuilt from scratch
+COMMITS_CACHE_STATE = "data/cache/org_commits_state.json"
+
+# The API's `since` filters on committer date, so commits merged from an older
+# branch can predate the last run. Incremental runs re-fetch this window before
+# the previous run (deduplicated by sha); anything older is only picked up by
+# the periodic full refresh.
+INCREMENTAL_OVERLAP = dt.timedelta(days=90)
+FULL_REFRESH_INTERVAL = dt.timedelta(days=180)
+
 COMBINED_PLOT = "assets/reports/teaching_research_lab_handbook_commits_per_month.png"
 HANDBOOK_PLOT = "assets/reports/handbook_activity_over_time.png"
 
@@ -62,46 +93,53 @@ def make_jan_jun_ticks(dates):
 # ----------------------------------------------------------------------
 
 
-def iter_topic_repos(org, topic, exclude_names=None):
-    """Yield repos in the org whose GitHub 'topics' include the given topic."""
+def iter_topic_repos(g, topic, exclude_names=None):
+    """
+    Yield non-archived repos in the org whose GitHub 'topics' include the
+    given topic, using one repository search instead of per-repo topic calls.
+    """
     exclude_names = set(exclude_names or [])
 
-    for repo in org.get_repos():
-        if repo.archived:
-            continue
-
+    # fork:true keeps forks in the results, as org.get_repos() did
+    query = f"org:{ORG_NAME} topic:{topic} archived:false fork:true"
+    for repo in g.search_repositories(query=query):
         if repo.name in exclude_names:
             continue
 
-        try:
-            topics = repo.get_topics()
-        except GithubException as e:
-            print(f"Could not get topics for {repo.full_name}: {e}")
-            continue
-
-        if topic in topics:
-            print(f"Using repo (topic '{topic}'): {repo.full_name}")
-            yield repo
+        print(f"Using repo (topic '{topic}'): {repo.full_name}")
+        yield repo
 
 
-def collect_lines_added_for_repo(repo, path_suffix="paper.md"):
+def collect_lines_added_for_repo(repo, path_suffix="paper.md", cached_rows=None, since=None):
     """
-    For a given repo, return list of dicts:
+    For a given repo, return list of dicts (one per commit, including commits
+    without additions so that they can be cached):
     {
         'repo': repo_name,
+        'sha': commit sha,
         'date': date (datetime.date),
         'lines_added': additions_to *path_suffix* in commit
     }
+
+    If since is given, only commits since then are fetched and merged with
+    cached_rows.
     """
-    rows = []
+    rows = list(cached_rows or [])
+    known_shas = {r["sha"] for r in rows}
+
+    kwargs = {"path": path_suffix}
+    if since is not None:
+        kwargs["since"] = since
 
     try:
-        commits = repo.get_commits(path=path_suffix)
+        commits = repo.get_commits(**kwargs)
     except GithubException as e:
         print(f"Could not get commits for {repo.full_name}: {e}")
         return rows
 
     for c in commits:
+        if c.sha in known_shas:
+            continue
         full_commit = repo.get_commit(c.sha)
         commit_date = full_commit.commit.author.date.date()
 
@@ -110,103 +148,221 @@ def collect_lines_added_for_repo(repo, path_suffix="paper.md"):
             if f.filename.endswith(path_suffix):
                 lines_added += f.additions
 
-        if lines_added > 0:
-            rows.append(
-                {
-                    "repo": repo.name,
-                    "date": commit_date,
-                    "lines_added": lines_added,
-                }
-            )
+        rows.append(
+            {
+                "repo": repo.name,
+                "sha": c.sha,
+                "date": commit_date,
+                "lines_added": lines_added,
+            }
+        )
 
     return rows
 
 
-def collect_md_lines_added_for_repo(repo):
+def collect_md_lines_added_for_repo(repo, cached_rows=None, since=None):
     """
     For a given repo, count additions in all markdown files (*.md, *.markdown) per commit.
 
-    Returns list of dicts:
+    Returns list of dicts (one per commit, including commits without additions):
     {
         'repo': repo_name,
+        'sha': commit sha,
         'date': date (datetime.date),
         'lines_added': additions_to_all_md_files_in_commit
     }
+
+    If since is given, only commits since then are fetched and merged with
+    cached_rows.
     """
-    rows = []
+    rows = list(cached_rows or [])
+    known_shas = {r["sha"] for r in rows}
+
+    kwargs = {}
+    if since is not None:
+        kwargs["since"] = since
 
     try:
-        commits = repo.get_commits()
+        commits = repo.get_commits(**kwargs)
     except GithubException as e:
         print(f"Could not get commits for {repo.full_name}: {e}")
         return rows
 
     for c in commits:
+        if c.sha in known_shas:
+            continue
         full_commit = repo.get_commit(c.sha)
         commit_date = full_commit.commit.author.date.date()
 
         lines_added = 0
         for f in full_commit.files:
-            if f.filename.endswith(".md") or f.filename.endswith(".markdown"):
+            if f.filename.endswith(MD_EXTS):
                 lines_added += f.additions
 
-        if lines_added > 0:
-            rows.append(
-                {
-                    "repo": repo.name,
-                    "date": commit_date,
-                    "lines_added": lines_added,
-                }
-            )
+        rows.append(
+            {
+                "repo": repo.name,
+                "sha": c.sha,
+                "date": commit_date,
+                "lines_added": lines_added,
+            }
+        )
 
     return rows
 
 
+def load_commit_cache(path=COMMITS_CACHE_CSV):
+    """Return cached per-commit rows as {(kind, repo_name): [row, ...]}."""
+    cache = defaultdict(list)
+    if not os.path.exists(path):
+        return cache
+
+    df = pd.read_csv(path, dtype={"kind": str, "repo": str, "sha": str, "date": str})
+    for row in df.to_dict("records"):
+        kind = row.pop("kind")
+        row["date"] = dt.date.fromisoformat(row["date"])
+        row["lines_added"] = int(row["lines_added"])
+        cache[(kind, row["repo"])].append(row)
+    return cache
+
+
+def save_commit_cache(cache, path=COMMITS_CACHE_CSV):
+    """Write per-commit rows ({(kind, repo_name): [row, ...]}) to the cache CSV."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    rows = [
+        {"kind": kind, **row}
+        for (kind, _), repo_rows in sorted(cache.items())
+        for row in sorted(repo_rows, key=lambda r: (r["date"], r["sha"]))
+    ]
+    pd.DataFrame(rows, columns=["kind", "repo", "sha", "date", "lines_added"]).to_csv(
+        path, index=False
+    )
+    print(f"Wrote commit cache to {path}")
+
+
+def load_cache_state(path=COMMITS_CACHE_STATE):
+    """Return {'fetched_at': datetime, 'full_refresh_at': datetime} or {} if unknown."""
+    if not os.path.exists(path):
+        return {}
+    with open(path, encoding="utf-8") as f:
+        state = json.load(f)
+    return {key: dt.datetime.fromisoformat(value) for key, value in state.items()}
+
+
+def save_cache_state(state, path=COMMITS_CACHE_STATE):
+    """Write the cache timestamps as ISO strings."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({key: value.isoformat() for key, value in state.items()}, f, indent=2)
+        f.write("\n")
+
+
+def incremental_since(state, now):
+    """
+    Start of the fetch window for an incremental run: the previous run minus
+    INCREMENTAL_OVERLAP. None (fetch everything) if there is no previous run or
+    the last full refresh is older than FULL_REFRESH_INTERVAL.
+    """
+    if "fetched_at" not in state or "full_refresh_at" not in state:
+        return None
+    if now - state["full_refresh_at"] >= FULL_REFRESH_INTERVAL:
+        return None
+    return state["fetched_at"] - INCREMENTAL_OVERLAP
+
+
 def aggregate_activity(rows, csv_path, group_label):
     """
     Turn a list of per-commit rows into:
     - a per-repo-per-month CSV (lines_added, commits)
     - an aggregated per-month DataFrame with columns ['date', 'commits'].
+
+    Commits without additions are ignored.
     """
+    rows = [r for r in rows if r["lines_added"] > 0]
     if not rows:
         print(f"No data collected for {group_label}.")
         return pd.DataFrame(columns=["date", "commits"])
 
-    df = pd.DataFrame(rows)
-    df["date"] = pd.to_datetime(df["date"])
-    df["year_month"] = df["date"].dt.to_period("M").dt.to_timestamp()
-
-    per_repo_month = df.groupby(["repo", "year_month"], as_index=False).agg(
-        lines_added=("lines_added", "sum"),
-        commits=("lines_added", "size"),
+    # Group with sort + np.add.reduceat (pandas groupby overhead dominates for
+    # the few thousand rows we have)
+    repos = np.array([r["repo"] for r in rows], dtype=object)
+    months = np.array([r["date"] for r in rows], dtype="datetime64[D]").astype(
+        "datetime64[M]"
+    )
+    lines_added = np.array([r["lines_added"] for r in rows], dtype=np.int64)
+
+    order = np.lexsort((months, repos))
+    repos, months, lines_added = repos[order], months[order], lines_added[order]
+    new_group = (repos[1:] != repos[:-1]) | (months[1:] != months[:-1])
+    starts = np.r_[0, np.flatnonzero(new_group) + 1]
+
+    per_repo_month = pd.DataFrame(
+        {
+            "repo": repos[starts],
+            "year_month": months[starts].astype("datetime64[ns]"),
+            "lines_added": np.add.reduceat(lines_added, starts),
+            "commits": np.diff(np.r_[starts, len(months)]),
+        }
     )
 
     per_repo_month.to_csv(csv_path, index=False)
     print(f"Wrote {group_label} per-project activity to {csv_path}")
 
-    agg = per_repo_month.groupby("year_month", as_index=False)["commits"].sum()
-    agg.rename(columns={"year_month": "date"}, inplace=True)
+    repo_months = months[starts]
+    commits = per_repo_month["commits"].to_numpy()
+    month_order = np.argsort(repo_months, kind="stable")
+    repo_months, commits = repo_months[month_order], commits[month_order]
+    month_starts = np.r_[0, np.flatnonzero(repo_months[1:] != repo_months[:-1]) + 1]
+
+    agg = pd.DataFrame(
+        {
+            "date": repo_months[month_starts].astype("datetime64[ns]"),
+            "commits": np.add.reduceat(commits, month_starts),
+        }
+    )
     return agg
 
 
-def collect_org_activity(github_token):
-    """Collect activity for research / teaching / lab-management repos."""
-    g = Github(github_token)
-    org = g.get_organization(ORG_NAME)
+def _collect_rows(ex, kind, repos, collect, cache, since):
+    """
+    Run collect(repo, cached_rows=..., since=...) for all repos concurrently on
+    the executor, store each repo's rows in cache[(kind, repo_name)] and return
+    all rows.
+    """
+    results = ex.map(
+        lambda repo: collect(
+            repo, cached_rows=cache.get((kind, repo.name)), since=since
+        ),
+        repos,
+    )
+    all_rows = []
+    for repo, repo_rows in zip(repos, results):
+        cache[(kind, repo.name)] = repo_rows
+        all_rows.extend(repo_rows)
+    return all_rows
 
-    # ----- RESEARCH: topic 'research', focus on paper.md -----
-    all_rows_research = []
-    for repo in iter_topic_repos(org, "research"):
-        repo_rows = collect_lines_added_for_repo(repo, path_suffix="paper.md")
-        all_rows_research.extend(repo_rows)
 
-    agg_research = aggregate_activity(
-        all_rows_research,
-        RESEARCH_CSV,
-        group_label="research (topic 'research')",
-    )
+def collect_org_activity(github_token, incremental=False):
+    """
+    Collect activity for research / teaching / lab-management repos.
+
+    Repos are processed concurrently (the per-commit API calls are I/O bound).
+    With incremental=True, per-commit rows are read from / written to
+    COMMITS_CACHE_CSV and only commits from the window given by
+    incremental_since() are fetched (or everything, on a full refresh).
+    """
+    g = Github(github_token)
+
+    now = dt.datetime.now(dt.timezone.utc)
+    state = load_cache_state() if incremental else {}
+    since = incremental_since(state, now)
+    if since is None:
+        cache = defaultdict(list)
+        if incremental:
+            print("Commit cache missing or due for a full refresh; fetching all commits")
+    else:
+        cache = load_commit_cache()
 
-    # ----- TEACHING: topic 'teaching', all markdown -----
     teaching_excludes = {
         "test-quartz",
         "thesis-test",
@@ -216,29 +372,62 @@ def collect_org_activity(github_token):
         "digital-work-lecture-exam",
     }
 
-    all_rows_teaching = []
-    for repo in iter_topic_repos(org, "teaching", exclude_names=teaching_excludes):
-        repo_rows = collect_md_lines_added_for_repo(repo)
-        all_rows_teaching.extend(repo_rows)
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as ex:
+        # ----- RESEARCH: topic 'research', focus on paper.md -----
+        all_rows_research = _collect_rows(
+            ex,
+            "research",
+            list(iter_topic_repos(g, "research")),
+            partial(collect_lines_added_for_repo, path_suffix="paper.md"),
+            cache,
+            since,
+        )
 
+        # ----- TEACHING: topic 'teaching', all markdown -----
+        all_rows_teaching = _collect_rows(
+            ex,
+            "teaching",
+            list(iter_topic_repos(g, "teaching", exclude_names=teaching_excludes)),
+            collect_md_lines_added_for_repo,
+            cache,
+            since,
+        )
+
+        # ----- LAB-MANAGEMENT: topic 'lab-management', all markdown -----
+        all_rows_lab = _collect_rows(
+            ex,
+            "lab-management",
+            list(iter_topic_repos(g, "lab-management")),
+            collect_md_lines_added_for_repo,
+            cache,
+            since,
+        )
+
+    agg_research = aggregate_activity(
+        all_rows_research,
+        RESEARCH_CSV,
+        group_label="research (topic 'research')",
+    )
     agg_teaching = aggregate_activity(
         all_rows_teaching,
         TEACH_CSV,
         group_label="teaching (topic 'teaching')",
     )
-
-    # ----- LAB-MANAGEMENT: topic 'lab-management', all markdown -----
-    all_rows_lab = []
-    for repo in iter_topic_repos(org, "lab-management"):
-        repo_rows = collect_md_lines_added_for_repo(repo)
-        all_rows_lab.extend(repo_rows)
-
     agg_lab = aggregate_activity(
         all_rows_lab,
         LAB_CSV,
         group_label="lab-management (topic 'lab-management')",
     )
 
+    if incremental:
+        save_commit_cache(cache)
+        save_cache_state(
+            {
+                "fetched_at": now,
+                "full_refresh_at": now if since is None else state["full_refresh_at"],
+            }
+        )
+
     return agg_research, agg_teaching, agg_lab
 
 
@@ -255,23 +444,25 @@ def run(cmd):
 
 
 def get_commits(branch="main"):
-    """Return list of commit dicts with hash, date, author (oldest -> newest)."""
-    log_output = run(
-        [
-            "git",
-            "log",
-            branch,
-            "--reverse",
-            "--pretty=format:%H%x09%ad%x09%ae",
-            "--date=short",
-        ]
-    )
-    commits = []
-    for line in log_output.splitlines():
-        commit_hash, date_str, author = line.split("\t")
-        date = dt.date.fromisoformat(date_str)
-        commits.append({"hash": commit_hash, "date": date, "author": author})
-    return commits
+    """Yield commit dicts with hash, date, author (oldest -> newest), streamed from git log."""
+    cmd = [
+        "git",
+        "log",
+        branch,
+        "--reverse",
+        "--pretty=format:%H%x09%ad%x09%ae",
+        "--date=short",
+    ]
+    with subprocess.Popen(cmd, stdout=subprocess.PIPE, text=True) as proc:
+        for line in proc.stdout:
+            line = line.rstrip("\n")
+            if not line:
+                continue
+            commit_hash, date_str, author = line.split("\t")
+            date = dt.date.fromisoformat(date_str)
+            yield {"hash": commit_hash, "date": date, "author": author}
+    if proc.returncode:
+        raise subprocess.CalledProcessError(proc.returncode, cmd)
 
 
 def list_markdown_files_at_commit(commit_hash):
@@ -279,17 +470,40 @@ def list_markdown_files_at_commit(commit_hash):
     tree_output = run(["git", "ls-tree", "-r", "--name-only", commit_hash])
     files = []
     for line in tree_output.splitlines():
-        p = PurePosixPath(line)
-        if (str(p).startswith("docs/") or str(p) == "index.md") and p.suffix in {
-            ".md",
-            ".markdown",
-        }:
-            files.append(str(p))
+        if (line.startswith("docs/") or line == "index.md") and line.endswith(MD_EXTS):
+            files.append(line)
     return files
 
 
-def get_file_content_at_commit(commit_hash, path):
-    return run(["git", "show", f"{commit_hash}:{path}"])
+def get_file_contents_at_commit(commit_hash, paths):
+    """
+    Return {path: content} for the given paths at a commit, read with a single
+    `git cat-file --batch` call instead of one `git show` per file.
+    Contents are stripped raw bytes (not decoded; only newlines are counted).
+    """
+    request = "".join(f"{commit_hash}:{path}\n" for path in paths).encode("utf-8")
+    result = subprocess.run(
+        ["git", "cat-file", "--batch"],
+        input=request,
+        check=True,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+    )
+    out = result.stdout
+
+    contents = {}
+    pos = 0
+    for path in paths:
+        header_end = out.index(b"\n", pos)
+        header = out[pos:header_end].split()
+        pos = header_end + 1
+        if header[-1] == b"missing":
+            contents[path] = b""
+            continue
+        size = int(header[2])
+        contents[path] = out[pos : pos + size].strip()
+        pos += size + 1  # content is followed by a newline
+    return contents
 
 
 def sample_commits(commits, step="month"):
@@ -307,19 +521,37 @@ def sample_commits(commits, step="month"):
     return sorted(by_key.values(), key=lambda x: x["date"])
 
 
+def monthly_commit_activity(commits):
+    """
+    Return {(year, month): (commits, contributors)} for the given commits,
+    computed with np.unique/np.bincount instead of per-commit dict updates.
+    """
+    months = np.array([c["date"] for c in commits], dtype="datetime64[M]")
+    month_keys, month_idx = np.unique(months, return_inverse=True)
+    commits_per_month = np.bincount(month_idx, minlength=len(month_keys))
+
+    # Distinct (month, author) pairs -> contributors per month
+    _, author_idx = np.unique(
+        np.array([c["author"] for c in commits], dtype=object), return_inverse=True
+    )
+    n_authors = int(author_idx.max()) + 1 if len(author_idx) else 1
+    pairs = np.unique(month_idx * n_authors + author_idx)
+    contributors_per_month = np.bincount(pairs // n_authors, minlength=len(month_keys))
+
+    activity = {}
+    for key, n_commits, n_contributors in zip(
+        month_keys.tolist(), commits_per_month.tolist(), contributors_per_month.tolist()
+    ):
+        activity[(key.year, key.month)] = (n_commits, n_contributors)
+    return activity
+
+
 def collect_handbook_stats(branch="main"):
     """Return DataFrame of handbook stats (similar to original collect_stats)."""
-    commits = get_commits(branch)
+    commits = list(get_commits(branch))  # scanned twice below
     sampled = sample_commits(commits, step="month")
 
-    # Monthly activity: commits per month & contributors per month
-    monthly_activity = {}
-    for c in commits:
-        d = c["date"]
-        key = (d.year, d.month)
-        entry = monthly_activity.setdefault(key, {"commits": 0, "authors": set()})
-        entry["commits"] += 1
-        entry["authors"].add(c["author"])
+    monthly_activity = monthly_commit_activity(commits)
 
     rows = []
 
@@ -333,25 +565,24 @@ def collect_handbook_stats(branch="main"):
         total_lines = 0
         section_counts = defaultdict(int)
 
+        contents = get_file_contents_at_commit(commit_hash, md_files)
+
         for path in md_files:
-            content = get_file_content_at_commit(commit_hash, path)
-            lines = content.splitlines()
-            total_lines += len(lines)
+            # Contents are stripped, so lines = newlines + 1 (0 for empty files)
+            content = contents[path]
+            if content:
+                total_lines += content.count(b"\n") + 1
 
             if path.startswith("docs/"):
-                name = PurePosixPath(path).name
-                prefix = name.split(".")[0]
-                try:
-                    section_number = int(prefix)
-                    top_level_section = (section_number // 10) * 10
-                except ValueError:
-                    top_level_section = 0
+                m = SECTION_NUMBER_RE.match(path.rpartition("/")[2])
+                top_level_section = (int(m.group(1)) // 10) * 10 if m else 0
                 section_counts[top_level_section] += 1
             else:
                 section_counts[0] += 1
 
-        activity = monthly_activity.get((year, month), {"commits": 0, "authors": set()})
-        commits_in_month = activity["commits"]
+        commits_in_month, contributors_in_month = monthly_activity.get(
+            (year, month), (0, 0)
+        )
 
         days_in_month = calendar.monthrange(year, month)[1]
         weeks_in_month = days_in_month / 7.0 if days_in_month else 1.0
@@ -365,7 +596,7 @@ def collect_handbook_stats(branch="main"):
             "num_files": len(md_files),
             "total_lines": total_lines,
             "commits_in_month": commits_in_month,
-            "contributors_in_month": len(activity["authors"]),
+            "contributors_in_month": contributors_in_month,
             "avg_weekly_commits_in_month": avg_weekly_commits,
         }
         for sec in sorted(section_counts.keys()):
@@ -377,15 +608,21 @@ def collect_handbook_stats(branch="main"):
     return df
 
 
-def write_and_plot_handbook(df):
-    """Write handbook CSV and plot handbook_activity_over_time.png."""
+def write_and_plot_handbook(df, ax=None):
+    """
+    Write handbook CSV and plot handbook_activity_over_time.png.
+
+    Draws on `ax` when given (the caller clears it), else on a new figure.
+    """
     df.to_csv(HANDBOOK_CSV, index=False)
     print(f"Wrote handbook growth data to {HANDBOOK_CSV}")
 
     df = df.copy()
     df["date"] = pd.to_datetime(df["date"])
 
-    fig, ax = plt.subplots(figsize=(12, 4.5))
+    if ax is None:
+        _, ax = plt.subplots(figsize=(12, 4.5))
+    fig = ax.figure
 
     # activity
     ax.plot(
@@ -429,7 +666,7 @@ def write_and_plot_handbook(df):
         plt.setp(ax.get_xticklabels(), rotation=45, ha="right")
 
     fig.tight_layout()
-    plt.savefig(HANDBOOK_PLOT, dpi=150)
+    fig.savefig(HANDBOOK_PLOT, dpi=150)
     print(f"Saved handbook activity plot to {HANDBOOK_PLOT}")
 
 
@@ -461,8 +698,12 @@ def aggregate_handbook_monthly(df):
 # ----------------------------------------------------------------------
 
 
-def plot_combined(agg_research, agg_teaching, agg_lab, agg_handbook):
-    """Plot combined commits per month (research / teaching / lab / handbook)."""
+def plot_combined(agg_research, agg_teaching, agg_lab, agg_handbook, ax=None):
+    """
+    Plot combined commits per month (research / teaching / lab / handbook).
+
+    Draws on `ax` when given (the caller clears it), else on a new figure.
+    """
     if (
         agg_research.empty
         and agg_teaching.empty
@@ -483,9 +724,11 @@ def plot_combined(agg_research, agg_teaching, agg_lab, agg_handbook):
     if not agg_handbook.empty:
         date_series_list.append(agg_handbook["date"])
 
-    dates_for_ticks = pd.concat(date_series_list, ignore_index=True)
+    dates_for_ticks = np.concatenate([s.to_numpy() for s in date_series_list])
 
-    fig, ax = plt.subplots(figsize=(12, 4.5))
+    if ax is None:
+        _, ax = plt.subplots(figsize=(12, 4.5))
+    fig = ax.figure
 
     if not agg_research.empty:
         ax.plot(
@@ -528,8 +771,10 @@ def plot_combined(agg_research, agg_teaching, agg_lab, agg_handbook):
 
     ticks = make_jan_jun_ticks(dates_for_ticks)
     # x-limits from actual data range, not from the artificial Jan/Jun ticks
-    if not dates_for_ticks.empty:
-        ax.set_xlim(dates_for_ticks.min(), dates_for_ticks.max())
+    if dates_for_ticks.size:
+        ax.set_xlim(
+            pd.Timestamp(dates_for_ticks.min()), pd.Timestamp(dates_for_ticks.max())
+        )
     if ticks:
         ax.set_xticks(ticks)
         ax.xaxis.set_major_formatter(mdates.DateFormatter("%Y-%m"))
@@ -537,7 +782,7 @@ def plot_combined(agg_research, agg_teaching, agg_lab, agg_handbook):
 
     ax.legend(loc="upper left")
     fig.tight_layout()
-    plt.savefig(COMBINED_PLOT, dpi=150)
+    fig.savefig(COMBINED_PLOT, dpi=150)
     print(f"Saved combined commits plot to {COMBINED_PLOT}")
 
 
@@ -546,19 +791,37 @@ def plot_combined(agg_research, agg_teaching, agg_lab, agg_handbook):
 # ----------------------------------------------------------------------
 
 
-def main():
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help=f"reuse per-commit rows cached in {COMMITS_CACHE_CSV} and only fetch new commits",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
     token = os.environ["GITHUB_TOKEN"]
 
     # 1) Org-wide stats (research / teaching / lab-management)
-    agg_research, agg_teaching, agg_lab = collect_org_activity(token)
+    agg_research, agg_teaching, agg_lab = collect_org_activity(
+        token, incremental=args.incremental
+    )
+
+    # One figure shared by both plots
+    fig, ax = plt.subplots(figsize=(12, 4.5))
 
     # 2) Handbook growth (local repo)
     handbook_df = collect_handbook_stats(branch="main")
-    write_and_plot_handbook(handbook_df)
+    write_and_plot_handbook(handbook_df, ax=ax)
     agg_handbook = aggregate_handbook_monthly(handbook_df)
 
     # 3) Combined commits plot including handbook
-    plot_combined(agg_research, agg_teaching, agg_lab, agg_handbook)
+    ax.clear()
+    plot_combined(agg_research, agg_teaching, agg_lab, agg_handbook, ax=ax)
+    plt.close(fig)
 
 
 if __name__ == "__main__":
@@ -54,3 +54,12 @@ def write_events_yaml(events: list[dict[str, Any]], path: Path = EVENTS_PATH) ->
         width=4096,
     )
     path.write_text(text, encoding="utf-8")
+
+
+def write_if_changed(path: Path, text: str) -> bool:
+    """Write text unless the file already has identical content (avoids Quarto rebuilds)."""
+    data = text.encode("utf-8")
+    if path.is_file() and path.read_bytes() == data:
+        return False
+    path.write_bytes(data)
+    return True
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import hashlib
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime
 
@@ -12,17 +13,24 @@ from zoneinfo import ZoneInfo
 
 from icalendar import Calendar, Event
 
+try:  # libyaml-backed loader when available
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # pure-Python fallback
+    from yaml import SafeLoader
+
 
 BERLIN = ZoneInfo("Europe/Berlin")
 UTC = ZoneInfo("UTC")
 
 
+@lru_cache(maxsize=2048)
 def parse_dt(value: str) -> datetime:
     """
     Accepts:
       - "YYYY-MM-DD HH:MM"
       - ISO strings like "2025-01-17T13:00:00Z" / "2025-01-17T13:00:00+01:00"
     Returns timezone-aware datetime in Europe/Berlin.
+    Results are cached; datetimes are immutable, so sharing them is safe.
     """
     value = value.strip()
     if "T" in value:  # ISO-ish
@@ -72,9 +80,10 @@ def expand_events(events: list[dict]) -> list[dict]:
             # RRULE.parseString equivalent:
             rule = rrule.rrulestr(ev["recurrence"], dtstart=start)
 
-            for occ_start in rule:
-                occ_end = occ_start + duration
-                expanded.append({**base, "start": occ_start, "end": occ_end})
+            expanded.extend(
+                {**base, "start": occ_start, "end": occ_start + duration}
+                for occ_start in rule
+            )
         else:
             expanded.append({**base, "start": start, "end": end})
 
@@ -130,7 +139,7 @@ def main() -> None:
     out_path = Path("assets/calendar/fs-ise.ical")
     out_path.parent.mkdir(parents=True, exist_ok=True)
 
-    raw = yaml.safe_load(yaml_path.read_text(encoding="utf-8"))
+    raw = yaml.load(yaml_path.read_bytes(), Loader=SafeLoader)
     if not isinstance(raw, list):
         raise ValueError("Parsed YAML is not a list")
 
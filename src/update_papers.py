@@ -2,9 +2,8 @@
 """
 Generate Quarto .qmd paper files from a records.bib file using CoLRev.
 
-- Removes all existing files in research/papers before generation
-- For each record, creates research/papers/<ID>.qmd
-- If research/papers/<ID>.qmd already exists (after cleanup), it is skipped
+- For each record, writes research/papers/<ID>.qmd (only if its content changed)
+- Removes files in research/papers that no longer correspond to a record
 - The Summary section is based on the record's abstract field
 - If fulltext_oa is present, adds a Bootstrap button linking to the PDF
   (URL or repo-root-relative path; label depends on oa_status)
@@ -26,12 +25,14 @@ import datetime as dt
 
 import json
 import html
+import os
+import re
 import shutil
 from pathlib import Path
 from typing import List, Iterable, Dict, Any, Optional, Tuple
 
 import colrev.loader.load_utils as load_utils
-import colrev.writer.write_utils as write_utils
+from sync_utils import write_if_changed
 
 
 OUTPUT_DIR_RESEARCH = Path("research/papers")
@@ -40,6 +41,9 @@ ASSETS_REFERENCES = Path("data/references.bib")
 
 DEFAULT_BODY_TEMPLATE = """"""
 
+# Reference year for the self-archiving flags (fixed for the whole run)
+CURRENT_YEAR = dt.date.today().year
+
 ALLOWED_ENTRYTYPES = {
     "article",
     "inproceedings",
@@ -56,6 +60,18 @@ ENTRYTYPE_NORMALIZATION = {
     "baThesis".lower(): "bachelorthesis",
 }
 
+# Separator between names in a BibTeX author field (any whitespace around "and")
+AUTHOR_SEP_RE = re.compile(r"\s+and\s+")
+
+# "Last, Given" author names (split on the first comma)
+AUTHOR_LAST_FIRST_RE = re.compile(r"([^,]*),(.*)", re.S)
+
+# First character of each whitespace-separated given name
+INITIAL_RE = re.compile(r"(\S)\S*")
+
+# Characters json.dumps escapes as \uXXXX / \n etc. (yaml_quote defers to it then)
+CONTROL_CHAR_RE = re.compile(r"[\x00-\x1f]")
+
 # Fields that should be stripped from the exported references.bib
 FIELDS_TO_STRIP_FOR_REFERENCES = {
     # "ENTRYTYPE",
@@ -98,6 +114,32 @@ FIELDS_TO_STRIP_FOR_REFERENCES = {
     "news_announced",
 }
 
+# CoLRev-internal fields (colrev_*, colrev.<package>.*) are stripped by prefix,
+# so provenance fields added upstream do not leak into the BibTeX output
+INTERNAL_FIELD_PREFIX = "colrev"
+
+# Fields left out of the ad-hoc BibTeX block on each paper page
+BIBTEX_SKIP_FIELDS = frozenset(FIELDS_TO_STRIP_FOR_REFERENCES) | {
+    "ID",
+    "ENTRYTYPE",
+    "keywords",
+}
+
+# Line breaks / tabs inside a field value become spaces in the BibTeX block
+BIBTEX_VALUE_TRANSLATION = str.maketrans({"\n": " ", "\r": " ", "\t": " "})
+
+# BibTeX entry type -> RIS type (anything else is GEN)
+RIS_TYPE_MAP = {
+    "article": "JOUR",
+    "inproceedings": "CONF",
+    "proceedings": "CONF",
+    "conference": "CONF",
+    "book": "BOOK",
+    "phdthesis": "THES",
+    "mastersthesis": "THES",
+    "techreport": "RPRT",
+}
+
 
 # ----------------------------------------------------------------------
 # Helpers for citations (BibTeX, RIS, APA)
@@ -111,6 +153,21 @@ def yaml_escape(value: str) -> str:
     return str(value).replace('"', '\\"')
 
 
+def yaml_quote(value: str) -> str:
+    """
+    Double-quote a string for YAML; same output as json.dumps(value, ensure_ascii=False)
+    without the encoder overhead for the common no-control-character case.
+    """
+    if CONTROL_CHAR_RE.search(value):
+        return json.dumps(value, ensure_ascii=False)
+    return '"' + value.replace("\\", "\\\\").replace('"', '\\"') + '"'
+
+
+def yaml_quote_list(values: List[str]) -> str:
+    """Flow-style YAML list of quoted strings (same as json.dumps of the list)."""
+    return "[" + ", ".join(yaml_quote(v) for v in values) + "]"
+
+
 def record_to_bibtex(rec: dict) -> str:
     """Reconstruct a BibTeX entry from a record dict."""
     entrytype = rec.get("ENTRYTYPE", "article")
@@ -119,48 +176,33 @@ def record_to_bibtex(rec: dict) -> str:
     if not key:
         raise ValueError("Record is missing a citation key (ID / citation_key / colrev_id).")
 
-    field_lines: List[str] = []
-    max_field_len = 10
-    for field, value in rec.items():
-        if field in FIELDS_TO_STRIP_FOR_REFERENCES:
-            # We also don't want these in the ad-hoc BibTeX block
-            continue
-        if field in ["ID", "ENTRYTYPE", "keywords"]:
-            continue
-        if value is None or value == "":
-            continue
-
-        v = str(value).replace("\n", " ").strip()
-        field_lines.append(f"  {field:<{max_field_len}} = {{{v}}},")
+    field_lines = [
+        f"  {field:<10} = {{{str(value).translate(BIBTEX_VALUE_TRANSLATION).strip()}}}"
+        for field, value in rec.items()
+        if field not in BIBTEX_SKIP_FIELDS
+        and not field.startswith(INTERNAL_FIELD_PREFIX)
+        and value is not None
+        and value != ""
+    ]
 
+    lines = [f"@{entrytype}{{{key},"]
     if field_lines:
-        field_lines[-1] = field_lines[-1].rstrip(",")
-
-    lines = [f"@{entrytype}{{{key},"] + field_lines + ["}"]
+        lines.append(",\n".join(field_lines))
+    lines.append("}")
     return "\n".join(lines)
 
 
 def record_to_ris(rec: dict) -> str:
     """Convert a record dict to a single RIS entry."""
     entrytype = str(rec.get("ENTRYTYPE", "article")).lower()
-    type_map = {
-        "article": "JOUR",
-        "inproceedings": "CONF",
-        "proceedings": "CONF",
-        "conference": "CONF",
-        "book": "BOOK",
-        "phdthesis": "THES",
-        "mastersthesis": "THES",
-        "techreport": "RPRT",
-    }
-    ris_type = type_map.get(entrytype, "GEN")
+    ris_type = RIS_TYPE_MAP.get(entrytype, "GEN")
 
     lines = [f"TY  - {ris_type}"]
 
     # Authors
     authors = str(rec.get("author", "")).strip()
     if authors:
-        for a in authors.split(" and "):
+        for a in AUTHOR_SEP_RE.split(authors):
             a = a.strip()
             if a:
                 lines.append(f"AU  - {a}")
@@ -214,19 +256,18 @@ def _format_author_name_for_apa(author: str) -> str:
     if not author:
         return ""
 
-    if "," in author:
-        last, given = author.split(",", 1)
-        last = last.strip()
-        given_parts = [p for p in given.strip().split() if p]
+    m = AUTHOR_LAST_FIRST_RE.match(author)
+    if m:
+        last = m.group(1).strip()
+        given = m.group(2)
     else:
         # assume 'First Middle Last'
-        parts = [p for p in author.split() if p]
+        parts = author.rsplit(None, 1)
         if len(parts) == 1:
             return parts[0]
-        last = parts[-1]
-        given_parts = parts[:-1]
+        given, last = parts
 
-    initials = " ".join(f"{p[0]}." for p in given_parts if p)
+    initials = " ".join(f"{c}." for c in INITIAL_RE.findall(given))
     if initials:
         return f"{last}, {initials}"
     return last
@@ -237,7 +278,7 @@ def _format_authors_apa(authors_raw: str) -> str:
     if not authors_raw:
         return ""
 
-    authors = [a.strip() for a in authors_raw.split(" and ") if a.strip()]
+    authors = [a.strip() for a in AUTHOR_SEP_RE.split(authors_raw) if a.strip()]
     formatted = [_format_author_name_for_apa(a) for a in authors if a]
 
     if not formatted:
@@ -251,13 +292,15 @@ def _format_authors_apa(authors_raw: str) -> str:
     return ", ".join(formatted[:-1]) + f", & {formatted[-1]}"
 
 
-def format_apa_citation(rec: dict) -> str:
+def format_apa_citation(rec: dict, link: Optional[str] = None) -> str:
     """
     Create a simple APA-style citation string from a record dict.
 
     Example shape:
     Author, A. A., & Author, B. B. (2020). Title of the article.
     Journal Name, 10(2), 123–145. https://doi.org/xxx
+
+    `link` is the DOI/URL link if the caller already resolved it (as build_body does).
     """
     authors_raw = str(rec.get("author", "")).strip()
     authors_str = _format_authors_apa(authors_raw)
@@ -302,19 +345,22 @@ def format_apa_citation(rec: dict) -> str:
         outlet_str = " ".join(outlet_parts) + "."
 
     # DOI / URL
-    doi_raw = str(rec.get("doi", "")).strip()
-    if doi_raw and not doi_raw.startswith("http"):
-        doi = f"https://doi.org/{doi_raw}"
+    if link is not None:
+        link_str = link
     else:
-        doi = doi_raw
+        doi_raw = str(rec.get("doi", "")).strip()
+        if doi_raw and not doi_raw.startswith("http"):
+            doi = f"https://doi.org/{doi_raw}"
+        else:
+            doi = doi_raw
 
-    url = str(rec.get("url", "")).strip()
+        url = str(rec.get("url", "")).strip()
 
-    link_str = ""
-    if doi:
-        link_str = doi
-    elif url:
-        link_str = url
+        link_str = ""
+        if doi:
+            link_str = doi
+        elif url:
+            link_str = url
 
     parts: List[str] = []
     if authors_str:
@@ -335,64 +381,57 @@ def format_apa_citation(rec: dict) -> str:
 # ----------------------------------------------------------------------
 
 
-def load_records(path: Path) -> Iterable[Dict[str, Any]]:
-    """Load records via CoLRev's loader and normalize to an iterable of dicts."""
+def read_records(path: Path) -> Any:
+    """Parse the records file once via CoLRev's loader and return its raw result."""
     if not path.is_file():
         raise FileNotFoundError(f"Records file not found: {path}")
 
-    records = load_utils.load(filename=str(path))
-
-    # CoLRev may return a dict of records or a list-like – handle both
-    if isinstance(records, dict):
-        # Common pattern: {ID: record_dict, ...}
-        return records.values()
-    elif isinstance(records, (list, tuple)):
-        return records
-    else:
-        raise TypeError(
-            f"Unexpected records type from load_utils.load(): {type(records)}"
-        )
+    return load_utils.load(filename=str(path))
 
 
-def build_clean_references(path: Path) -> Dict[str, Dict[str, Any]]:
-    """
-    Load records via CoLRev and return a dict suitable for write_utils.write_file,
-    with internal / CoLRev-specific fields stripped.
+def _normalize_records(raw: Any) -> Dict[str, Dict[str, Any]]:
     """
-    raw = load_utils.load(filename=str(path))
-
-    clean: Dict[str, Dict[str, Any]] = {}
+    Normalize CoLRev's loader output to {key: record_dict}.
 
+    CoLRev may return a dict of records ({ID: record_dict, ...}) or a list-like;
+    for the latter, keys are reconstructed from ID / citation_key / colrev_id.
+    """
     if isinstance(raw, dict):
-        items = raw.items()
-    elif isinstance(raw, (list, tuple)):
-        # reconstruct keys from ID / citation_key / colrev_id
-        items = []
+        return dict(raw.items())
+    if isinstance(raw, (list, tuple)):
+        normalized: Dict[str, Dict[str, Any]] = {}
         for rec in raw:
-            rec = dict(rec)
-            key = (
-                rec.get("ID")
-                or rec.get("citation_key")
-                or rec.get("colrev_id")
-            )
+            key = rec.get("ID") or rec.get("citation_key") or rec.get("colrev_id")
             if not key:
+                print("Warning: skipping record without ID:", rec)
                 continue
-            items.append((key, rec))
-    else:
-        raise TypeError(
-            f"Unexpected records type from load_utils.load(): {type(raw)}"
-        )
+            normalized[key] = rec
+        return normalized
+    raise TypeError(f"Unexpected records type from load_utils.load(): {type(raw)}")
+
 
-    for key, rec in items:
-        rec = dict(rec)
-        # Ensure an ID is present
-        rec["ID"] = rec.get("ID") or rec.get("citation_key") or rec.get("colrev_id") or key
+def load_records(raw: Any) -> Iterable[Dict[str, Any]]:
+    """Return the records of an already-loaded CoLRev result as an iterable of dicts."""
+    return _normalize_records(raw).values()
 
-        for f in list(rec.keys()):
-            if f in FIELDS_TO_STRIP_FOR_REFERENCES:
-                rec.pop(f, None)
 
-        clean[rec["ID"]] = rec
+def build_clean_references(raw: Any) -> Dict[str, Dict[str, Any]]:
+    """
+    Return a dict suitable for write_utils.write_file from an already-loaded
+    CoLRev result, with internal / CoLRev-specific fields stripped.
+    """
+    clean: Dict[str, Dict[str, Any]] = {}
+    for key, rec in _normalize_records(raw).items():
+        # Ensure an ID is present (before citation_key / colrev_id are stripped)
+        rec_id = rec.get("ID") or rec.get("citation_key") or rec.get("colrev_id") or key
+        rec = {
+            f: v
+            for f, v in rec.items()
+            if f not in FIELDS_TO_STRIP_FOR_REFERENCES
+            and not f.startswith(INTERNAL_FIELD_PREFIX)
+        }
+        rec["ID"] = rec_id
+        clean[rec_id] = rec
 
     return clean
 
@@ -419,6 +458,42 @@ def get_field(record: Dict[str, Any], *names: str, default: str = "") -> str:
     return default
 
 
+# Single-name fields read by build_yaml_header / build_body
+PROJECTED_FIELDS = (
+    "title",
+    "year",
+    "volume",
+    "number",
+    "pages",
+    "doi",
+    "url",
+    "author",
+    "keywords",
+    "abstract",
+    "oa_status",
+    "fulltext_oa",
+    "author_copy_url",
+    "author_copy_file",
+    "summary_url",
+    "appendix_url",
+    "dataset_url",
+    "dataset_doi",
+    "code_url",
+)
+
+
+def _project(record: Dict[str, Any]) -> Dict[str, str]:
+    """
+    Return {field: stripped string} for PROJECTED_FIELDS in one pass
+    (same values as get_field(record, field).strip()).
+    """
+    projected: Dict[str, str] = {}
+    for name in PROJECTED_FIELDS:
+        value = record.get(name)
+        projected[name] = str(value).strip() if value else ""
+    return projected
+
+
 def build_authors_metadata(record: Dict[str, Any]) -> List[Dict[str, str]]:
     """Build a list of author dicts with optional ORCID from record.
 
@@ -436,7 +511,7 @@ def build_authors_metadata(record: Dict[str, Any]) -> List[Dict[str, str]]:
         return []
 
     # Split BibTeX author string: "Last, First and Last2, First2"
-    names = [a.strip() for a in raw_authors.split(" and ") if a.strip()]
+    names = [a.strip() for a in AUTHOR_SEP_RE.split(raw_authors) if a.strip()]
 
     # ORCIDs (optional), positionally aligned with authors, e.g. ";0000-...;"
     raw_orcids = str(record.get("author+an:orcid", "")).strip()
@@ -471,14 +546,16 @@ def build_authors_metadata(record: Dict[str, Any]) -> List[Dict[str, str]]:
 
 
 
-def _format_publication_details(record: Dict[str, Any]) -> Tuple[str, str, str]:
+def _format_publication_details(
+    record: Dict[str, Any], p: Dict[str, str]
+) -> Tuple[str, str, str]:
     """Return (outlet, details, combined) publication metadata strings."""
     outlet = get_field(record, "outlet", "journal", "booktitle", default="").strip()
 
-    year = get_field(record, "year", default="").strip()
-    volume = get_field(record, "volume", default="").strip()
-    number = get_field(record, "number", default="").strip()
-    pages = get_field(record, "pages", default="").strip()
+    year = p["year"]
+    volume = p["volume"]
+    number = p["number"]
+    pages = p["pages"]
 
     detail_parts: List[str] = []
     if year:
@@ -511,7 +588,22 @@ def _format_publication_details(record: Dict[str, Any]) -> Tuple[str, str, str]:
 
     return outlet, details, combined
 
-def build_yaml_header(record: Dict[str, Any]) -> str:
+
+# Static end of every YAML header (closing --- plus the line break before the body)
+YAML_HEADER_TAIL = (
+    "format:\n"
+    "  html:\n"
+    "    title-block: false\n"
+    "    page-layout: full\n"
+    "    include-before-body: ../../_partials/header.html\n"
+    "    include-after-body: ../../assets/metrics-scripts.html\n"
+    "---\n"
+)
+
+
+def build_yaml_header(
+    record: Dict[str, Any], p: Optional[Dict[str, str]] = None
+) -> str:
     """
     Build a YAML header string from a CoLRev record.
 
@@ -532,9 +624,14 @@ def build_yaml_header(record: Dict[str, Any]) -> str:
       false -> no OA/fulltext and no author copy
     - self_archiving_possible_1y / _2y:
       true  -> free_fulltext == false and record is >= 1 / 2 years old
+
+    `p` is the record's _project() result; it is computed here if omitted.
     """
-    title = get_field(record, "title").strip()
-    year_str = get_field(record, "year").strip()
+    if p is None:
+        p = _project(record)
+
+    title = p["title"]
+    year_str = p["year"]
 
     # Try to parse year as int (use first 4 chars to be robust)
     year_int: Optional[int] = None
@@ -544,24 +641,24 @@ def build_yaml_header(record: Dict[str, Any]) -> str:
         except ValueError:
             year_int = None
 
-    raw_keywords = get_field(record, "keywords", default="")
+    raw_keywords = p["keywords"]
     keywords = split_keywords(raw_keywords)
 
     # categories based on keywords, fallback
     categories = keywords if keywords else ["research-paper"]
 
-    doi = get_field(record, "doi", default="").strip()
-    url = get_field(record, "url", default="").strip()
+    doi = p["doi"]
+    url = p["url"]
 
     # new fields
     journal_name = get_field(record, "journal", "journal.name", default="").strip()
-    outlet, publication_details, publication_header = _format_publication_details(record)
-    author = get_field(record, "author", default="").strip()
+    outlet, publication_details, publication_header = _format_publication_details(record, p)
+    author = p["author"]
 
     # fulltext / author copy info for availability flag
-    fulltext_oa = get_field(record, "fulltext_oa", default="").strip()
-    author_copy_url = get_field(record, "author_copy_url", default="").strip()
-    author_copy_file = get_field(record, "author_copy_file", default="").strip()
+    fulltext_oa = p["fulltext_oa"]
+    author_copy_url = p["author_copy_url"]
+    author_copy_file = p["author_copy_file"]
 
     has_free_fulltext = bool(fulltext_oa or author_copy_url or author_copy_file)
 
@@ -570,8 +667,7 @@ def build_yaml_header(record: Dict[str, Any]) -> str:
     self_archiving_possible_1y = False
     self_archiving_possible_2y = False
     if not has_free_fulltext and year_int is not None:
-        current_year = dt.date.today().year
-        age = current_year - year_int
+        age = CURRENT_YEAR - year_int
         if age >= 1:
             self_archiving_possible_1y = True
         if age >= 2:
@@ -584,56 +680,48 @@ def build_yaml_header(record: Dict[str, Any]) -> str:
     yaml_lines = ["---"]
 
     if title:
-        yaml_lines.append(f"title: {json.dumps(title, ensure_ascii=False)}")
+        yaml_lines.append(f"title: {yaml_quote(title)}")
     else:
         yaml_lines.append('title: ""  # TODO: add title')
 
     if year_str:
-        yaml_lines.append(f"date: {json.dumps(year_str, ensure_ascii=False)}")
+        yaml_lines.append(f"date: {yaml_quote(year_str)}")
     else:
         yaml_lines.append('date: ""  # TODO: add year')
     yaml_lines.append('date-format: "YYYY"')
 
-    yaml_lines.append(f"categories: {json.dumps(categories, ensure_ascii=False)}")
-    yaml_lines.append(f"keywords: {json.dumps(keywords, ensure_ascii=False)}")
+    yaml_lines.append(f"categories: {yaml_quote_list(categories)}")
+    yaml_lines.append(f"keywords: {yaml_quote_list(keywords)}")
 
     if doi:
-        yaml_lines.append(f"doi: {json.dumps(doi, ensure_ascii=False)}")
+        yaml_lines.append(f"doi: {yaml_quote(doi)}")
     if url:
-        yaml_lines.append(f"url: {json.dumps(url, ensure_ascii=False)}")
+        yaml_lines.append(f"url: {yaml_quote(url)}")
     if journal_name:
-        yaml_lines.append(
-            f"journal.name: {json.dumps(journal_name, ensure_ascii=False)}"
-        )
+        yaml_lines.append(f"journal.name: {yaml_quote(journal_name)}")
     if outlet:
-        yaml_lines.append(f"outlet: {json.dumps(outlet, ensure_ascii=False)}")
+        yaml_lines.append(f"outlet: {yaml_quote(outlet)}")
     if publication_details:
-        yaml_lines.append(
-            f"publication_details: {json.dumps(publication_details, ensure_ascii=False)}"
-        )
+        yaml_lines.append(f"publication_details: {yaml_quote(publication_details)}")
     if publication_header:
-        yaml_lines.append(
-            f"publication_header: {json.dumps(publication_header, ensure_ascii=False)}"
-        )
-        yaml_lines.append(f"subtitle: {json.dumps(publication_header, ensure_ascii=False)}")
+        yaml_lines.append(f"publication_header: {yaml_quote(publication_header)}")
+        yaml_lines.append(f"subtitle: {yaml_quote(publication_header)}")
 
     # keep flat author string for simple use
     if author:
-        yaml_lines.append(f"author: {json.dumps(author, ensure_ascii=False)}")
+        yaml_lines.append(f"author: {yaml_quote(author)}")
 
     # add structured authors list for Quarto + ORCID
     if authors_meta:
         yaml_lines.append("authors:")
         for a in authors_meta:
-            yaml_lines.append(f"  - name: {json.dumps(a['name'], ensure_ascii=False)}")
+            yaml_lines.append(f"  - name: {yaml_quote(a['name'])}")
             if "orcid" in a:
-                yaml_lines.append(
-                    f"    orcid: {json.dumps(a['orcid'], ensure_ascii=False)}"
-                )
+                yaml_lines.append(f"    orcid: {yaml_quote(a['orcid'])}")
 
     key = get_field(record, "ID", "id", default="")
     if key:
-        yaml_lines.append(f"citation_key: {json.dumps(key, ensure_ascii=False)}")
+        yaml_lines.append(f"citation_key: {yaml_quote(key)}")
 
     # availability flag
     yaml_lines.append(f"free_fulltext: {'true' if has_free_fulltext else 'false'}")
@@ -645,21 +733,93 @@ def build_yaml_header(record: Dict[str, Any]) -> str:
     yaml_lines.append(
         f"self_archiving_possible_2y: {'true' if self_archiving_possible_2y else 'false'}"
     )
-    yaml_lines.append(
-        "format:\n"
-        "  html:\n"
-        "    title-block: false\n"
-        "    page-layout: full\n"
-        "    include-before-body: ../../_partials/header.html\n"
-        "    include-after-body: ../../assets/metrics-scripts.html"
-    )
-    yaml_lines.append("---")
-    yaml_lines.append("")  # blank line before body
-
-    return "\n".join(yaml_lines)
 
-
-def build_body(record: Dict[str, Any], template_body: str) -> str:
+    return "\n".join(yaml_lines) + "\n" + YAML_HEADER_TAIL
+
+
+# Characters html.escape(..., quote=True) replaces
+HTML_SPECIAL_CHARS = frozenset("&<>\"'")
+
+# Static HTML / Markdown snippets of the page body, filled via str.format
+BTN_LANDING_TMPL = (
+    '  <a class="btn btn-sm btn-outline-secondary me-2" href="{href}" '
+    'target="_blank" role="button">\n'
+    '    <i class="bi bi-box-arrow-up-right"></i> Article / DOI link\n'
+    "  </a>"
+)
+
+BTN_AUTHOR_COPY_TMPL = (
+    '  <a class="btn btn-sm btn-outline-secondary me-2" href="{href}" '
+    'target="_blank" role="button">\n'
+    '    <i class="bi bi-file-earmark-text"></i> Author copy\n'
+    "  </a>"
+)
+
+BTN_FULLTEXT_TMPL = (
+    '  <a class="btn btn-sm btn-outline-primary" href="{href}" '
+    'target="_blank" role="button">\n'
+    '    <i class="bi bi-file-earmark-pdf"></i> {label}\n'
+    "  </a>"
+)
+
+PDF_IFRAME_TMPL = (
+    "## {label}\n\n"
+    '<iframe src="{href}" width="100%" height="800px" '
+    'style="border: 1px solid #ccc;">\n'
+    "  This browser does not support PDFs. "
+    "Please use the button above to download the PDF.\n"
+    "</iframe>\n"
+)
+
+METRICS_TMPL = (
+    "\n"
+    "```{{=html}}\n"
+    '<div class="metrics-row">\n\n'
+    "  <!-- Altmetric badge -->\n"
+    '  <div class="metric">\n'
+    '    <div class="altmetric-embed"\n'
+    '         data-badge-type="donut"\n'
+    '         data-badge-popover="right"\n'
+    '         data-doi="{doi_attr}"\n'
+    '         data-hide-no-mentions="true">\n'
+    "    </div>\n"
+    "  </div>\n\n"
+    "  <!-- Dimensions badge -->\n"
+    '  <div class="metric">\n'
+    '    <span class="__dimensions_badge_embed__"\n'
+    '          data-doi="{doi_attr}"\n'
+    '          data-style="small_circle"\n'
+    '          data-hide-zero-citations="true"\n'
+    '          data-legend="hover-right">\n'
+    "    </span>\n"
+    "  </div>\n\n"
+    "  <!-- scite.ai badge -->\n"
+    '  <div class="metric">\n'
+    '    <div class="scite-badge"\n'
+    '         data-doi="{doi_attr}">\n'
+    "    </div>\n"
+    "  </div>\n\n"
+    "</div>\n"
+    "```\n"
+)
+
+APA_SECTION_TMPL = (
+    "## Citation (APA)\n\n"
+    '<div class="apa-citation">\n'
+    '<p style="text-indent:-2.5em; margin-left:2.5em;">\n'
+    "{citation}\n"
+    "</p>\n"
+    "</div>\n"
+)
+
+BIBTEX_SECTION_TMPL = "## Citation: BibTeX\n\n```bibtex\n{entry}\n```\n"
+
+RIS_SECTION_TMPL = "## Citation: RIS\n\n```bibtex\n{entry}\n```\n"
+
+
+def build_body(
+    record: Dict[str, Any], template_body: str, p: Optional[Dict[str, str]] = None
+) -> str:
     """
     Build the .qmd body content:
 
@@ -678,8 +838,13 @@ def build_body(record: Dict[str, Any], template_body: str) -> str:
     - If fulltext_oa or author_copy_file is present, embeds the PDF in the page
     - Then appends the template body (with an initial '# Summary' removed if present)
     - Then appends APA-style citation (with hanging indent), BibTeX, and RIS sections.
+
+    `p` is the record's _project() result; it is computed here if omitted.
     """
-    abstract = get_field(record, "abstract", default="").strip()
+    if p is None:
+        p = _project(record)
+
+    abstract = p["abstract"]
 
     # Replace newlines with HTML breaks FIRST
     abstract = abstract.replace("\\n", "\n\n")
@@ -688,8 +853,8 @@ def build_body(record: Dict[str, Any], template_body: str) -> str:
     abstract = html.escape(abstract).replace("&lt;br&gt;", "<br>")
 
     # Link button from DOI/URL (landing page)
-    doi_raw = get_field(record, "doi", default="").strip()
-    url_raw = get_field(record, "url", default="").strip()
+    doi_raw = p["doi"]
+    url_raw = p["url"]
 
     landing_link = ""
     if doi_raw and not doi_raw.startswith("http"):
@@ -700,8 +865,8 @@ def build_body(record: Dict[str, Any], template_body: str) -> str:
         landing_link = url_raw
 
     # Author copy buttons / file (e.g., preprint / postprint)
-    author_copy_url = get_field(record, "author_copy_url", default="").strip()
-    author_copy_file_raw = get_field(record, "author_copy_file", default="").strip()
+    author_copy_url = p["author_copy_url"]
+    author_copy_file_raw = p["author_copy_file"]
 
     author_copy_file_href = ""
     if author_copy_file_raw:
@@ -712,8 +877,8 @@ def build_body(record: Dict[str, Any], template_body: str) -> str:
             author_copy_file_href = "/" + author_copy_file_raw.lstrip("/")
 
     # OA status and full text PDF
-    oa_status = get_field(record, "oa_status", default="").strip().lower()
-    fulltext_oa_raw = get_field(record, "fulltext_oa", default="").strip()
+    oa_status = p["oa_status"].lower()
+    fulltext_oa_raw = p["fulltext_oa"]
 
     fulltext_oa_href = ""
     if fulltext_oa_raw:
@@ -738,13 +903,8 @@ def build_body(record: Dict[str, Any], template_body: str) -> str:
     pdf_embed_label = fulltext_label if fulltext_oa_href else "Author-copy PDF"
 
     if pdf_embed_href:
-        pdf_embed_block = (
-            f"## {pdf_embed_label}\n\n"
-            f'<iframe src="{pdf_embed_href}" width="100%" height="800px" '
-            'style="border: 1px solid #ccc;">\n'
-            "  This browser does not support PDFs. "
-            'Please use the button above to download the PDF.\n'
-            "</iframe>\n"
+        pdf_embed_block = PDF_IFRAME_TMPL.format(
+            label=pdf_embed_label, href=pdf_embed_href
         )
 
     # Build a single centered button bar
@@ -753,29 +913,15 @@ def build_body(record: Dict[str, Any], template_body: str) -> str:
         btns: List[str] = []
 
         if landing_link:
-            btns.append(
-                f'  <a class="btn btn-sm btn-outline-secondary me-2" href="{landing_link}" '
-                'target="_blank" role="button">\n'
-                '    <i class="bi bi-box-arrow-up-right"></i> Article / DOI link\n'
-                "  </a>"
-            )
+            btns.append(BTN_LANDING_TMPL.format(href=landing_link))
 
         author_copy_href = author_copy_url or author_copy_file_href
         if author_copy_href:
-            btns.append(
-                f'  <a class="btn btn-sm btn-outline-secondary me-2" href="{author_copy_href}" '
-                'target="_blank" role="button">\n'
-                '    <i class="bi bi-file-earmark-text"></i> Author copy\n'
-                "  </a>"
-            )
+            btns.append(BTN_AUTHOR_COPY_TMPL.format(href=author_copy_href))
 
         if fulltext_oa_href:
             btns.append(
-                f'  <a class="btn btn-sm btn-outline-primary" href="{fulltext_oa_href}" '
-                'target="_blank" role="button">\n'
-                '    <i class="bi bi-file-earmark-pdf"></i> '
-                f"{fulltext_label}\n"
-                "  </a>"
+                BTN_FULLTEXT_TMPL.format(href=fulltext_oa_href, label=fulltext_label)
             )
 
         buttons_block = (
@@ -797,11 +943,11 @@ def build_body(record: Dict[str, Any], template_body: str) -> str:
     parts.append(summary_block)
 
     # --- Additional resources --------------------------------------------
-    summary_url = get_field(record, "summary_url", default="").strip()
-    appendix_url = get_field(record, "appendix_url", default="").strip()
-    dataset_url = get_field(record, "dataset_url", default="").strip()
-    dataset_doi_raw = get_field(record, "dataset_doi", default="").strip()
-    code_url = get_field(record, "code_url", default="").strip()
+    summary_url = p["summary_url"]
+    appendix_url = p["appendix_url"]
+    dataset_url = p["dataset_url"]
+    dataset_doi_raw = p["dataset_doi"]
+    code_url = p["code_url"]
 
     dataset_doi_link = ""
     if dataset_doi_raw:
@@ -850,98 +996,67 @@ def build_body(record: Dict[str, Any], template_body: str) -> str:
     metrics_block = ""
     if doi_raw:
         doi_attr = html.escape(doi_raw, quote=True)
-        metrics_block = (
-            "\n"
-            "```{=html}\n"
-            '<div class="metrics-row">\n\n'
-            "  <!-- Altmetric badge -->\n"
-            '  <div class="metric">\n'
-            '    <div class="altmetric-embed"\n'
-            '         data-badge-type="donut"\n'
-            '         data-badge-popover="right"\n'
-            f'         data-doi="{doi_attr}"\n'
-            '         data-hide-no-mentions="true">\n'
-            "    </div>\n"
-            "  </div>\n\n"
-            "  <!-- Dimensions badge -->\n"
-            '  <div class="metric">\n'
-            '    <span class="__dimensions_badge_embed__"\n'
-            f'          data-doi="{doi_attr}"\n'
-            '          data-style="small_circle"\n'
-            '          data-hide-zero-citations="true"\n'
-            '          data-legend="hover-right">\n'
-            "    </span>\n"
-            "  </div>\n\n"
-            "  <!-- scite.ai badge -->\n"
-            '  <div class="metric">\n'
-            '    <div class="scite-badge"\n'
-            f'         data-doi="{doi_attr}">\n'
-            "    </div>\n"
-            "  </div>\n\n"
-            "</div>\n"
-            "```\n"
-        )
+        metrics_block = METRICS_TMPL.format(doi_attr=doi_attr)
         parts.append(metrics_block)
 
     # --- Citation sections -------------------------------------------------
-    apa_citation = format_apa_citation(record).strip()
+    apa_citation = format_apa_citation(record, link=landing_link).strip()
     if apa_citation:
-        escaped_citation = html.escape(apa_citation)
-        parts.append(
-            "## Citation (APA)\n\n"
-            '<div class="apa-citation">\n'
-            '<p style="text-indent:-2.5em; margin-left:2.5em;">\n'
-            f"{escaped_citation}\n"
-            "</p>\n"
-            "</div>\n"
-        )
+        # Most citations contain nothing html.escape would change
+        if HTML_SPECIAL_CHARS.isdisjoint(apa_citation):
+            escaped_citation = apa_citation
+        else:
+            escaped_citation = html.escape(apa_citation)
+        parts.append(APA_SECTION_TMPL.format(citation=escaped_citation))
 
     bibtex_entry = record_to_bibtex(record)
     if bibtex_entry.strip():
-        parts.append(
-            "## Citation: BibTeX\n\n"
-            "```bibtex\n"
-            f"{bibtex_entry}\n"
-            "```\n"
-        )
+        parts.append(BIBTEX_SECTION_TMPL.format(entry=bibtex_entry))
 
     ris_entry = record_to_ris(record)
     if ris_entry.strip():
-        parts.append(
-            "## Citation: RIS\n\n"
-            "```bibtex\n"
-            f"{ris_entry}\n"
-            "```\n"
-        )
+        parts.append(RIS_SECTION_TMPL.format(entry=ris_entry))
 
     return "\n\n".join(parts).rstrip() + "\n"
 
 
+def render_record(record: Dict[str, Any]) -> str:
+    """Render a prepared record to its .qmd content."""
+    p = _project(record)
+    yaml_header = build_yaml_header(record, p)
+    body = build_body(record, load_body_template(), p)
+    return yaml_header + body
+
+
+def _remove_stale(out_dir: Path, keep: set[str]) -> int:
+    """Remove files/subdirs in out_dir whose names are not in keep; return how many."""
+    removed = 0
+    with os.scandir(out_dir) as entries:
+        for entry in entries:
+            if entry.name in keep:
+                continue
+            if entry.is_dir(follow_symlinks=False):
+                shutil.rmtree(entry.path)
+            else:
+                os.unlink(entry.path)
+            removed += 1
+    return removed
+
+
 def main():
 
     # --- Generate paper .qmd files ---------------------------------------
-    records_iter = load_records(ASSETS_REFERENCES)
-
-    # Ensure output dir exists and is empty before generation
-    if OUTPUT_DIR_RESEARCH.exists():
-        # Remove all files and subdirectories in research/papers
-        for child in OUTPUT_DIR_RESEARCH.iterdir():
-            if child.is_file():
-                child.unlink()
-            else:
-                shutil.rmtree(child)
-    else:
-        OUTPUT_DIR_RESEARCH.mkdir(parents=True, exist_ok=True)
+    raw_records = read_records(ASSETS_REFERENCES)
+    records_iter = load_records(raw_records)
 
-    # (Re)ensure directory exists (after potential deletion of subdirs)
     OUTPUT_DIR_RESEARCH.mkdir(parents=True, exist_ok=True)
 
     # Teaching output dir: ensure it exists (no cleanup by default)
     OUTPUT_DIR_TEACHING.mkdir(parents=True, exist_ok=True)
 
-    template_body = load_body_template()
-
+    written: set[str] = set()
     created = 0
+    unchanged = 0
     skipped = 0
     teaching_created = 0
     teaching_skipped = 0
@@ -965,19 +1080,19 @@ def main():
         # Ensure the record has ID for BibTeX/RIS generation
         record.setdefault("ID", key)
 
-        yaml_header = build_yaml_header(record)
-        body = build_body(record, template_body)
-        content = yaml_header + body
-
+        content = render_record(record)
         out_path = OUTPUT_DIR_RESEARCH / f"{key}.qmd"
 
-        if out_path.exists():
-            print(f"Skipping existing file: {out_path}")
+        if out_path.name in written:
+            print(f"Skipping duplicate record: {out_path}")
             skipped += 1
         else:
-            out_path.write_text(content, encoding="utf8")
-            print(f"Created {out_path}")
-            created += 1
+            written.add(out_path.name)
+            if write_if_changed(out_path, content):
+                print(f"Wrote {out_path}")
+                created += 1
+            else:
+                unchanged += 1
 
         # Export to teaching/papers if "teaching" is in keywords
         raw_keywords = get_field(record, "keywords", default="")
@@ -992,8 +1107,12 @@ def main():
                 print(f"Teaching export: created {teaching_path}")
                 teaching_created += 1
 
+    # Drop pages of records that are no longer in references.bib
+    removed = _remove_stale(OUTPUT_DIR_RESEARCH, keep=written)
+
     print(
-        f"\nDone. Created {created} file(s), skipped {skipped} existing file(s). "
+        f"\nDone. Wrote {created} file(s), {unchanged} unchanged, "
+        f"skipped {skipped} duplicate(s), removed {removed} stale file(s). "
         f"Teaching export: created {teaching_created}, skipped {teaching_skipped}."
     )
 
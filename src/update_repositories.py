@@ -1,6 +1,11 @@
 import os
 import json
+import hashlib
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
 from datetime import datetime, timedelta
 
@@ -10,9 +15,15 @@ ORG_NAMES = ["fs-ise", "digital-work-lab"]
 BASE_URL = "https://api.github.com"
 WORKFLOW_FILENAME = ".github/workflows/labot.yml"
 
+# Repos processed concurrently (each needs several API round-trips)
+MAX_WORKERS = 16
+
 cwd = Path.cwd()
 OUTPUT_JSON = cwd / "assets" / "repos.json"
 
+# ETag + body of previous API responses (restored by actions/cache in CI)
+GH_CACHE_DIR = cwd / ".cache" / "gh"
+
 GITHUB_TOKEN = os.getenv("GITHUB_TOKEN")
 if not GITHUB_TOKEN:
     raise EnvironmentError("The GITHUB_TOKEN environment variable is not set or empty.")
@@ -23,6 +34,28 @@ HEADERS = {
     "Accept": "application/vnd.github.mercy-preview+json",
 }
 
+
+def _build_session() -> requests.Session:
+    """Shared keep-alive session for api.github.com (one pool slot per worker) with retries."""
+    session = requests.Session()
+    session.headers.update(HEADERS)
+    # raise_on_status=False: callers inspect the final status code themselves
+    retries = Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=(502, 503, 504),
+        raise_on_status=False,
+    )
+    session.mount(
+        "https://",
+        HTTPAdapter(pool_connections=4, pool_maxsize=MAX_WORKERS, max_retries=retries),
+    )
+    return session
+
+
+SESSION = _build_session()
+
+
 # --- Display-title overrides for handbook site ---
 # Keep repo "name" unchanged (for URLs and API calls), but customize the "title" shown on the site.
 REPO_TITLE_OVERRIDES: dict[tuple[str, str], str] = {
@@ -30,14 +63,52 @@ REPO_TITLE_OVERRIDES: dict[tuple[str, str], str] = {
 }
 
 
+def cached_get(url: str, params: dict | None = None) -> tuple[int, object]:
+    """
+    GET a GitHub API URL with If-None-Match and return (status_code, json).
+
+    200 responses carrying an ETag are stored in GH_CACHE_DIR; a 304 answer
+    (which does not count against the rate limit) returns the stored body.
+    """
+    cache_key = url + "?" + json.dumps(params or {}, sort_keys=True)
+    cache_file = GH_CACHE_DIR / f"{hashlib.sha1(cache_key.encode('utf-8')).hexdigest()}.json"
+
+    cached = None
+    headers = None
+    if cache_file.is_file():
+        try:
+            cached = json.loads(cache_file.read_text(encoding="utf-8"))
+            headers = {"If-None-Match": cached["etag"]}
+        except (ValueError, KeyError):
+            cached = None
+
+    response = SESSION.get(url, headers=headers, params=params)
+    if response.status_code == 304 and cached is not None:
+        return 200, cached["body"]
+
+    try:
+        body = response.json()
+    except ValueError:
+        body = None
+
+    etag = response.headers.get("ETag")
+    if response.status_code == 200 and etag:
+        GH_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp_file = cache_file.with_suffix(".tmp")
+        tmp_file.write_text(json.dumps({"etag": etag, "body": body}), encoding="utf-8")
+        os.replace(tmp_file, cache_file)
+
+    return response.status_code, body
+
+
 def get_workflow_id_by_filename(owner: str, repo_name: str, workflow_filename: str) -> int | None:
     """Gets the workflow ID for a specific workflow file in the repository."""
     url = f"{BASE_URL}/repos/{owner}/{repo_name}/actions/workflows"
-    response = requests.get(url, headers=HEADERS)
-    if response.status_code != 200:
-        raise Exception(f"Error fetching workflows for {owner}/{repo_name}: {response.json()}")
+    status, data = cached_get(url)
+    if status != 200:
+        raise Exception(f"Error fetching workflows for {owner}/{repo_name}: {data}")
 
-    workflows = response.json().get("workflows", [])
+    workflows = data.get("workflows", [])
     for workflow in workflows:
         if workflow.get("path", "").lower() == workflow_filename.lower():
             return workflow["id"]
@@ -51,11 +122,11 @@ def get_workflow_status(owner: str, repo_name: str, workflow_id: int | None) ->
         return "not-found"
 
     url = f"{BASE_URL}/repos/{owner}/{repo_name}/actions/workflows/{workflow_id}/runs"
-    response = requests.get(url, headers=HEADERS)
-    if response.status_code != 200:
-        raise Exception(f"Error fetching workflow runs for {owner}/{repo_name}: {response.json()}")
+    status, data = cached_get(url)
+    if status != 200:
+        raise Exception(f"Error fetching workflow runs for {owner}/{repo_name}: {data}")
 
-    runs = response.json().get("workflow_runs", [])
+    runs = data.get("workflow_runs", [])
     if not runs:
         return "no-runs"
 
@@ -71,15 +142,10 @@ def get_org_repositories(org_name: str) -> list[dict]:
     page = 1
 
     while True:
-        response = requests.get(
-            url,
-            headers=HEADERS,
-            params={"page": page, "per_page": 100},
-        )
-        if response.status_code != 200:
-            raise Exception(f"Error fetching repositories for {org_name} (page {page}): {response.json()}")
+        status, repos = cached_get(url, params={"page": page, "per_page": 100})
+        if status != 200:
+            raise Exception(f"Error fetching repositories for {org_name} (page {page}): {repos}")
 
-        repos = response.json()
         if not repos:
             break
 
@@ -92,16 +158,16 @@ def get_org_repositories(org_name: str) -> list[dict]:
 def get_repo_collaborators(owner: str, repo_name: str) -> list[str]:
     """Return a filtered list of collaborators for a repo."""
     url = f"{BASE_URL}/repos/{owner}/{repo_name}/collaborators"
-    response = requests.get(url, headers=HEADERS)
+    status, data = cached_get(url)
 
-    if response.status_code == 403:
+    if status == 403:
         return ["Access Denied: Requires admin rights"]
-    if response.status_code != 200:
+    if status != 200:
         # silently ignore other errors for collaborators
         return []
 
     collaborators = []
-    for collab in response.json():
+    for collab in data:
         login = collab.get("login")
         if login not in ["geritwagner", "digital-work-labot"]:
             collaborators.append(login)
@@ -111,13 +177,12 @@ def get_repo_collaborators(owner: str, repo_name: str) -> list[str]:
 def get_project_type(owner: str, repo_name: str) -> list[str]:
     """Infer project type(s) from files in the repository root."""
     repo_contents_url = f"{BASE_URL}/repos/{owner}/{repo_name}/contents"
-    response = requests.get(repo_contents_url, headers=HEADERS)
+    status, contents = cached_get(repo_contents_url)
 
-    if response.status_code != 200:
-        print(f"Error fetching repository contents for {owner}/{repo_name}: {response.json()}")
+    if status != 200:
+        print(f"Error fetching repository contents for {owner}/{repo_name}: {contents}")
         return []
 
-    contents = response.json()
     file_names = [content.get("name") for content in contents]
     p_types: list[str] = []
 
@@ -146,6 +211,51 @@ def get_display_title(owner: str, repo_name: str) -> str:
     return REPO_TITLE_OVERRIDES.get((owner, repo_name), repo_name)
 
 
+def process_repo(org_name: str, repo: dict, six_months_ago: datetime) -> dict:
+    """Collect the API details of one repository and build its repos.json record."""
+    print(f"Processing {repo['full_name']}...")
+
+    topics = repo.get("topics") or []
+    area = classify_area(repo["name"], topics)
+
+    workflow_id = get_workflow_id_by_filename(org_name, repo["name"], WORKFLOW_FILENAME)
+    labot_workflow_status = get_workflow_status(org_name, repo["name"], workflow_id)
+
+    # Build base record
+    repo_data: dict = {
+        "owner": org_name,
+        "name": repo["name"],
+        "title": get_display_title(org_name, repo["name"]),  # <-- updated
+        "html_url": repo["html_url"],
+        "visibility": "Private" if repo.get("private") else "Public",
+        "description": repo.get("description") or "",
+        "area": area,
+        "topics": topics,
+        "created_at": repo.get("created_at"),
+        "archived": repo.get("archived", False),
+        "collaborators": get_repo_collaborators(org_name, repo["name"]),
+        "updated_recently": datetime.strptime(
+            repo["pushed_at"], "%Y-%m-%dT%H:%M:%SZ"
+        )
+        > six_months_ago,
+        "labot_workflow_status": labot_workflow_status,
+        "project_type": get_project_type(org_name, repo["name"]),
+    }
+
+    # Paper classification tweak as before
+    if "paper" in topics and "paper" not in repo_data["project_type"]:
+        repo_data["project_type"].append("paper")
+
+    # Determine where Labot is applicable
+    if not (
+        "paper" in repo_data["project_type"]
+        or "teaching-materials" in topics
+    ):
+        repo_data["labot_workflow_status"] = "not-applicable"
+
+    return repo_data
+
+
 def main() -> None:
     six_months_ago = datetime.now() - timedelta(days=180)
 
@@ -153,57 +263,22 @@ def main() -> None:
 
     result: list[dict] = []
 
-    for org_name in ORG_NAMES:
-        repos = get_org_repositories(org_name)
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as ex:
+        for org_name in ORG_NAMES:
+            repos = get_org_repositories(org_name)
 
-        for repo in repos:
             # Skip the GitHub Pages repo for this org (e.g., fs-ise/fs-ise.github.io)
             pages_repo_url = f"https://github.com/{org_name}/{org_name}.github.io"
-            if repo["html_url"] == pages_repo_url:
-                print(f"Skipping {repo['full_name']} (GitHub Pages repo)")
-                continue
-
-            print(f"Processing {repo['full_name']}...")
-
-            topics = repo.get("topics") or []
-            area = classify_area(repo["name"], topics)
-
-            workflow_id = get_workflow_id_by_filename(org_name, repo["name"], WORKFLOW_FILENAME)
-            labot_workflow_status = get_workflow_status(org_name, repo["name"], workflow_id)
-
-            # Build base record
-            repo_data: dict = {
-                "owner": org_name,
-                "name": repo["name"],
-                "title": get_display_title(org_name, repo["name"]),  # <-- updated
-                "html_url": repo["html_url"],
-                "visibility": "Private" if repo.get("private") else "Public",
-                "description": repo.get("description") or "",
-                "area": area,
-                "topics": topics,
-                "created_at": repo.get("created_at"),
-                "archived": repo.get("archived", False),
-                "collaborators": get_repo_collaborators(org_name, repo["name"]),
-                "updated_recently": datetime.strptime(
-                    repo["pushed_at"], "%Y-%m-%dT%H:%M:%SZ"
-                )
-                > six_months_ago,
-                "labot_workflow_status": labot_workflow_status,
-                "project_type": get_project_type(org_name, repo["name"]),
-            }
-
-            # Paper classification tweak as before
-            if "paper" in topics and "paper" not in repo_data["project_type"]:
-                repo_data["project_type"].append("paper")
-
-            # Determine where Labot is applicable
-            if not (
-                "paper" in repo_data["project_type"]
-                or "teaching-materials" in topics
-            ):
-                repo_data["labot_workflow_status"] = "not-applicable"
-
-            result.append(repo_data)
+            selected = []
+            for repo in repos:
+                if repo["html_url"] == pages_repo_url:
+                    print(f"Skipping {repo['full_name']} (GitHub Pages repo)")
+                    continue
+                selected.append(repo)
+
+            # map() keeps the API order of repos in repos.json
+            process = partial(process_repo, org_name, six_months_ago=six_months_ago)
+            result.extend(ex.map(process, selected))
 
     # Write everything to assets/repos.json
     with open(OUTPUT_JSON, "w", encoding="utf-8") as f:
@@ -1,12 +1,9 @@
-from pathlib import Path
+import csv
 import re
-import textwrap
-
-import colrev.loader.load_utils
 from pathlib import Path
-import csv
 
 import colrev.loader.load_utils
+from sync_utils import write_if_changed
 
 # ---------------------------------------------------------
 # Input: your talks as BibTeX (CoLRev) records
@@ -15,10 +12,28 @@ BIB_PATH = Path("data/talks.bib")
 OUTPUT_DIR = Path("research/talks")
 CSV_PATH = Path("talk_places.csv")
 
+# Escapes for values inside double-quoted YAML scalars
+YAML_ESCAPE_TABLE = str.maketrans({'"': '\\"', "\\": "\\\\", "\n": "\\n"})
 
-def create_places_csv() -> None:
-    records = colrev.loader.load_utils.load(filename=str(BIB_PATH))
+# Runs of anything but [a-z0-9] (underscores included) become a single "_"
+SLUG_NON_ALNUM_RE = re.compile(r"[^a-z0-9]+")
 
+# Fixed parts of each talk page's YAML header
+YAML_HEADER_OPEN = "---\n"
+YAML_HEADER_CLOSE = "\nformat: html\n---"
+
+SLIDES_EMBED_TMPL = (
+    "```{{=html}}\n"
+    '<embed src="{url}"\n'
+    '       type="application/pdf"\n'
+    '       width="100%"\n'
+    '       height="600px" />\n'
+    "```\n"
+)
+
+
+def create_places_csv(records: dict) -> None:
+    """Write talk_places.csv from already-loaded records (only those with coordinates)."""
     # Define the CSV columns you want
     fieldnames = [
         "id",
@@ -30,65 +45,64 @@ def create_places_csv() -> None:
         "longitude",
     ]
 
+    # only export records that have coordinates; same order as fieldnames
+    rows = [
+        (
+            rec_id,
+            rec.get("title", ""),
+            rec.get("venue", ""),
+            rec.get("location", ""),
+            rec.get("date", ""),
+            rec["latitude"],
+            rec["longitude"],
+        )
+        for rec_id, rec in records.items()
+        if "latitude" in rec and "longitude" in rec
+    ]
+
     with CSV_PATH.open("w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-
-        for rec_id, rec in records.items():
-            # only export records that have coordinates
-            if "latitude" not in rec or "longitude" not in rec:
-                continue
-
-            row = {
-                "id": rec_id,
-                "title": rec.get("title", ""),
-                "venue": rec.get("venue", ""),
-                "location": rec.get("location", ""),
-                "date": rec.get("date", ""),
-                "latitude": rec.get("latitude", ""),
-                "longitude": rec.get("longitude", ""),
-            }
-            writer.writerow(row)
+        writer = csv.writer(f)
+        writer.writerow(fieldnames)
+        writer.writerows(rows)
 
     print(f"Wrote {CSV_PATH}")
 
 
+def _load_records(filename: Path) -> dict:
+    """Parse the BibTeX file once via CoLRev; returns {ID: record}."""
+    return colrev.loader.load_utils.load(filename=str(filename))
+
+
+def _rec_to_talk(rec_id: str, rec: dict) -> dict:
+    """Turn one CoLRev record into a talk dict used by build_qmd."""
+    # CoLRev / BibTeX fields
+    talk = {
+        "id": rec_id,
+        "title": (rec.get("title") or "").strip("{}"),
+        "venue": rec.get("venue") or rec.get("eventtitle"),
+        "location": rec.get("location"),
+        "date": rec.get("date"),  # e.g., 2015-12-15
+        "slides_url": rec.get("url"),
+        "howpublished": rec.get("howpublished") or rec.get("note"),
+        "paper_key": rec.get("paper_key"),
+    }
+    talk["slug"] = choose_slug(talk)
+    return talk
+
+
+def _records_to_talks(records: dict) -> list[dict]:
+    """Turn CoLRev records into talk dicts used by build_qmd / choose_slug."""
+    return [_rec_to_talk(rec_id, rec) for rec_id, rec in records.items()]
+
+
 def load_talks_from_bib(filename: Path):
     """Load talk-like records from a BibTeX file via CoLRev."""
-    records = colrev.loader.load_utils.load(filename=filename)
-
-    talks: list[dict] = []
-    for rec_id, rec in records.items():
-        # CoLRev / BibTeX fields
-        title = (rec.get("title") or "").strip("{}")
-        eventtitle = rec.get("eventtitle")
-        venue = rec.get("venue") or eventtitle
-        location = rec.get("location")
-        date = rec.get("date")  # e.g., 2015-12-15
-        url = rec.get("url")
-        howpublished = rec.get("howpublished") or rec.get("note")
-        paper_key = rec.get("paper_key")
-
-        talk = {
-            "id": rec_id,
-            "title": title,
-            "venue": venue,
-            "location": location,
-            "date": date,
-            "slides_url": url,
-            "howpublished": howpublished,
-            "paper_key": paper_key,
-        }
-        talks.append(talk)
-
-    return talks
+    return _records_to_talks(_load_records(filename))
 
 
 def slug_from_title(title: str, date: str | None = None) -> str:
     """Fallback slug from title and (optional) date."""
-    slug = title.lower()
-    slug = re.sub(r"[^a-z0-9]+", "_", slug)
-    slug = re.sub(r"_+", "_", slug).strip("_")
+    slug = SLUG_NON_ALNUM_RE.sub("_", title.lower()).strip("_")
     if date:
         date_prefix = date.replace("-", "_")
         slug = f"{date_prefix}_{slug}" if slug else date_prefix
@@ -141,43 +155,35 @@ def build_qmd(talk: dict) -> str:
 
     materials_block = "\n".join(materials) if materials else "_No materials linked._"
 
-    # Simple helper to escape double quotes for YAML
-    def _esc(val: str | None) -> str | None:
-        if val is None:
-            return None
-        return val.replace('"', '\\"')
+    meta_fields = (
+        ("date", date),
+        ("location", location),
+        ("venue", venue),
+        ("bibtex_id", bibtex_id),
+        ("howpublished", howpublished),
+        ("paper_key", paper_key),
+    )
+    meta_lines = [f'title: "{talk["title"].translate(YAML_ESCAPE_TABLE)}"']
+    meta_lines.extend(
+        f'{key}: "{value.translate(YAML_ESCAPE_TABLE)}"'
+        for key, value in meta_fields
+        if value
+    )
+
+    header = YAML_HEADER_OPEN + "\n".join(meta_lines) + YAML_HEADER_CLOSE
 
-    meta_lines = [
-        "---",
-        f'title: "{_esc(talk["title"])}"',
+    # show meta fields so you can change them in YAML and keep them in sync
+    info_fields = (
+        ("Venue", "venue", venue),
+        ("Location", "location", location),
+        ("Date", "date", date),
+        ("Type", "howpublished", howpublished),
+    )
+    info_lines = [
+        f"- **{label}:** {{{{< meta {key} >}}}}"
+        for label, key, value in info_fields
+        if value
     ]
-    if date:
-        meta_lines.append(f'date: "{_esc(date)}"')
-    if location:
-        meta_lines.append(f'location: "{_esc(location)}"')
-    if venue:
-        meta_lines.append(f'venue: "{_esc(venue)}"')
-    if bibtex_id:
-        meta_lines.append(f'bibtex_id: "{_esc(bibtex_id)}"')
-    if howpublished:
-        meta_lines.append(f'howpublished: "{_esc(howpublished)}"')
-    if paper_key:
-        meta_lines.append(f'paper_key: "{_esc(paper_key)}"')
-    meta_lines.append("format: html")
-    meta_lines.append("---")
-
-    header = "\n".join(meta_lines)
-
-    info_lines = []
-    if venue:
-        # show meta-field venue so you can change it in YAML and keep it in sync
-        info_lines.append(f"- **Venue:** {{{{< meta venue >}}}}")
-    if location:
-        info_lines.append(f"- **Location:** {{{{< meta location >}}}}")
-    if date:
-        info_lines.append(f"- **Date:** {{{{< meta date >}}}}")
-    if howpublished:
-        info_lines.append(f"- **Type:** {{{{< meta howpublished >}}}}")
 
     info_block = "\n".join(info_lines) if info_lines else "_Details not available._"
 
@@ -188,54 +194,42 @@ def build_qmd(talk: dict) -> str:
 
     # Slides embed (only if we have a PDF-like URL)
     if slides_url and slides_url.lower().endswith(".pdf"):
-        slides_embed = textwrap.dedent(
-            f"""\
-            ```{{=html}}
-            <embed src="{slides_url}"
-                   type="application/pdf"
-                   width="100%"
-                   height="600px" />
-            ```
-            """
-        )
+        slides_embed = SLIDES_EMBED_TMPL.format(url=slides_url)
     else:
         slides_embed = "_Slides not available as embedded PDF._"
 
-    body = textwrap.dedent(
-        f"""## Talk information
-
-{info_block}{related_block}
-
-::: {{.callout-note}}
-
-Slides coming soon...
-
-:::
-
-## Materials
-
-{materials_block}
-
-"""
-        # If you later want to show the embed again, you can re-enable this:
-        # f"## Slides\n\n{slides_embed}\n"
+    body = "".join(
+        [
+            "## Talk information\n\n",
+            info_block,
+            related_block,
+            "\n\n::: {.callout-note}\n\nSlides coming soon...\n\n:::\n\n",
+            "## Materials\n\n",
+            materials_block,
+            # If you later want to show the embed again, you can re-enable this:
+            # f"\n\n## Slides\n\n{slides_embed}",
+        ]
     )
 
     return header + "\n\n" + body.strip() + "\n"
 
 
 def main():
-    talks = load_talks_from_bib(BIB_PATH)
+    # Parse talks.bib once; both the pages and the places CSV use it
+    records = _load_records(BIB_PATH)
+    talks = _records_to_talks(records)
     OUTPUT_DIR.mkdir(exist_ok=True)
 
+    written = 0
     for talk in talks:
-        slug = choose_slug(talk)
-        qmd_path = OUTPUT_DIR / f"{slug}.qmd"
-        content = build_qmd(talk)
-        qmd_path.write_text(content, encoding="utf-8")
-        print(f"Written: {qmd_path}")
+        qmd_path = OUTPUT_DIR / f"{talk['slug']}.qmd"
+        if write_if_changed(qmd_path, build_qmd(talk)):
+            written += 1
+
+    print(f"Wrote {written} of {len(talks)} talk pages to {OUTPUT_DIR} (others unchanged)")
+
+    create_places_csv(records)
 
 
 if __name__ == "__main__":
     main()
-    create_places_csv()